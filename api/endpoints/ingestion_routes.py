@@ -2,82 +2,144 @@
 api/endpoints/ingestion_routes.py — Routes for triggering and checking ingestion.
 
 POST /ingestion/run   — Fetch + normalize + filter + save job postings
+POST /ingestion/jobs  — Same, as a background job (returns 202 + job id)
+GET  /ingestion/jobs/{job_id} — Poll a background ingestion job
 POST /ingestion/qualify — Run AI qualification on unprocessed postings
 GET  /ingestion/status  — Count of unprocessed postings in queue
 """
 
 import logging
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from app.db.session import get_db
-from app.db.repository import get_unprocessed_postings
-from app.services.lead_service import process_new_postings
-from api.schemas import IngestionRequest, IngestionResult, AiQualificationResult
+from app.db.session import get_db, get_session
+from app.db.repository import count_unprocessed_postings
+from app.services.lead_service import aprocess_new_postings
+from api.schemas import IngestionJobOut, IngestionRequest, IngestionResult, AiQualificationResult
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Background ingestion jobs, newest last. In-process only (the API runs as a
+# single uvicorn worker); the oldest entries are evicted past MAX_TRACKED_JOBS.
+MAX_TRACKED_JOBS = 100
+_jobs: "OrderedDict[str, IngestionJobOut]" = OrderedDict()
+
+
+def _store_jobs(raw_jobs: list[dict], db: Session) -> IngestionResult:
+    """Normalize, filter, and save fetched jobs (blocking — run off the event loop)."""
+    from app.ingestion.normalizer import normalize_jobs
+    from app.ingestion.filters import keyword_filter
+    from app.db.repository import store_new_postings
+
+    fetched = len(raw_jobs)
+
+    # 2. Normalize
+    normalized = normalize_jobs(raw_jobs)
+    norm_count = len(normalized)
+
+    # 3. Filter
+    filtered = keyword_filter(normalized)
+    filter_count = len(filtered)
+
+    # 4. Save (dedup by URL, resolve companies and insert, all in bulk)
+    saved = store_new_postings(db, filtered)
+    skipped = filter_count - saved
+    db.commit()
+
+    return IngestionResult(
+        fetched=fetched,
+        normalized=norm_count,
+        passed_filter=filter_count,
+        saved=saved,
+        skipped_duplicates=skipped,
+        message=f"Ingestion complete. {saved} new postings saved.",
+    )
+
+
+def _store_jobs_in_new_session(raw_jobs: list[dict]) -> IngestionResult:
+    """_store_jobs() with its own session — the request's is gone by the time a background job runs."""
+    with get_session() as db:
+        return _store_jobs(raw_jobs, db)
+
+
+async def _run_ingestion_job(job_id: str, limit: int) -> None:
+    """Background body of POST /ingestion/jobs; records the outcome on the job."""
+    from app.ingestion.fetcher import fetch_jobs_async
+
+    job = _jobs[job_id]
+    job.status = "running"
+    try:
+        raw_jobs = await fetch_jobs_async(limit=limit)
+        job.result = await run_in_threadpool(_store_jobs_in_new_session, raw_jobs)
+        job.status = "completed"
+    except Exception as exc:
+        logger.error("Ingestion job %s failed: %s", job_id, exc)
+        job.error = str(exc)
+        job.status = "failed"
+
 
 @router.post("/run", response_model=IngestionResult, summary="Run ingestion pipeline")
-def run_ingestion(request: IngestionRequest, db: Session = Depends(get_db)):
+async def run_ingestion(request: IngestionRequest, db: Session = Depends(get_db)):
     """
     Fetch job postings from RemoteOK, normalize, filter, and save new ones to the database.
     Returns a summary of what was fetched, filtered, and saved.
     """
     try:
-        from app.ingestion.fetcher import fetch_jobs
-        from app.ingestion.normalizer import normalize_jobs
-        from app.ingestion.filters import keyword_filter
-        from app.db.repository import job_posting_exists, get_or_create_company, save_job_posting
+        from app.ingestion.fetcher import fetch_jobs_async
 
         # 1. Fetch
-        raw_jobs = fetch_jobs(limit=request.limit)
-        fetched = len(raw_jobs)
-
-        # 2. Normalize
-        normalized = normalize_jobs(raw_jobs)
-        norm_count = len(normalized)
-
-        # 3. Filter
-        filtered = keyword_filter(normalized)
-        filter_count = len(filtered)
-
-        # 4. Save (dedup)
-        saved = 0
-        skipped = 0
-        for job in filtered:
-            if job_posting_exists(db, url=job.job_url):
-                skipped += 1
-                continue
-            company = get_or_create_company(db, job)
-            save_job_posting(db, job, company)
-            saved += 1
-        db.commit()
-
-        return IngestionResult(
-            fetched=fetched,
-            normalized=norm_count,
-            passed_filter=filter_count,
-            saved=saved,
-            skipped_duplicates=skipped,
-            message=f"Ingestion complete. {saved} new postings saved.",
-        )
+        raw_jobs = await fetch_jobs_async(limit=request.limit)
+
+        return await run_in_threadpool(_store_jobs, raw_jobs, db)
     except Exception as exc:
         logger.error("Ingestion failed: %s", exc)
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+@router.post(
+    "/jobs",
+    response_model=IngestionJobOut,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start ingestion in the background",
+)
+async def start_ingestion_job(request: IngestionRequest, background_tasks: BackgroundTasks):
+    """
+    Queue the ingestion pipeline and return immediately with a job id.
+    Poll GET /ingestion/jobs/{job_id} for progress and the final result.
+    """
+    job = IngestionJobOut(job_id=uuid.uuid4().hex, status="queued", created_at=datetime.now(timezone.utc))
+    _jobs[job.job_id] = job
+    while len(_jobs) > MAX_TRACKED_JOBS:
+        _jobs.popitem(last=False)
+
+    background_tasks.add_task(_run_ingestion_job, job.job_id, request.limit)
+    return job
+
+
+@router.get("/jobs/{job_id}", response_model=IngestionJobOut, summary="Get background ingestion job")
+def get_ingestion_job(job_id: str):
+    """Return the status (and, once finished, the result) of a background ingestion job."""
+    job = _jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Ingestion job {job_id} not found.")
+    return job
+
+
 @router.post("/qualify", response_model=AiQualificationResult, summary="Run AI qualification")
-def run_qualification(db: Session = Depends(get_db)):
+async def run_qualification(db: Session = Depends(get_db)):
     """
     Run AI lead qualification on all unprocessed job postings.
     Calls DeepSeek via OpenRouter to score and qualify each posting.
     """
     try:
-        result = process_new_postings()
+        result = await aprocess_new_postings()
         return AiQualificationResult(
             processed=result.get("processed", 0),
             qualified=result.get("qualified", 0),
@@ -99,8 +161,8 @@ def ingestion_status(
     db: Session = Depends(get_db),
 ):
     """Return the count of job postings not yet processed by the AI qualification step."""
-    unprocessed = get_unprocessed_postings(db, limit=limit)
+    unprocessed = count_unprocessed_postings(db, limit=limit)
     return {
-        "unprocessed_count": len(unprocessed),
-        "message": f"{len(unprocessed)} postings awaiting AI qualification.",
+        "unprocessed_count": unprocessed,
+        "message": f"{unprocessed} postings awaiting AI qualification.",
     }
@@ -10,49 +10,124 @@ GET    /leads/stats        — Aggregate counts by status
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, aliased
 
 from app.db.session import get_db
-from app.db.models import Lead, LeadStatus
-from app.db.repository import get_leads_by_status, update_lead_status
-from api.schemas import LeadOut, LeadStatusUpdate
+from app.db.models import Company, JobPosting, Lead, LeadStatus
+from app.db.repository import LEAD_RELATIONS, update_lead_status
+from api.etag import leads_etag
+from api.schemas import CompanyOut, JobPostingOut, LeadOut, LeadStatusUpdate
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get("/", response_model=list[LeadOut], summary="List leads")
+# ── List projection ───────────────────────────────────────────────────────────
+# /leads selects exactly the columns LeadOut serializes, in one joined query,
+# instead of loading full ORM graphs. Field lists come from the schemas so the
+# two can't drift apart.
+
+_LEAD_FIELDS = [f for f in LeadOut.model_fields if f not in ("company", "job_posting")]
+_COMPANY_FIELDS = list(CompanyOut.model_fields)
+_POSTING_FIELDS = [f for f in JobPostingOut.model_fields if f != "company"]
+_PostingCompany = aliased(Company)
+
+# Built once: validates the projected rows and dumps JSON in a single pass
+_LEADS_ADAPTER = TypeAdapter(list[LeadOut])
+
+
+def _labelled(entity, prefix: str, fields: list[str]) -> list:
+    return [getattr(entity, f).label(f"{prefix}{f}") for f in fields]
+
+
+def _nested(row, prefix: str, fields: list[str]) -> dict | None:
+    """Pull one prefixed group of columns out of a row; None for a missing outer join."""
+    if getattr(row, f"{prefix}id") is None:
+        return None
+    return {f: getattr(row, f"{prefix}{f}") for f in fields}
+
+
+def _lead_list_query(status: Optional[LeadStatus], limit: int, cursor: Optional[int]):
+    stmt = (
+        select(
+            *_labelled(Lead, "lead_", _LEAD_FIELDS),
+            *_labelled(Company, "company_", _COMPANY_FIELDS),
+            *_labelled(JobPosting, "posting_", _POSTING_FIELDS),
+            *_labelled(_PostingCompany, "posting_company_", _COMPANY_FIELDS),
+        )
+        .select_from(Lead)
+        .outerjoin(Company, Lead.company_id == Company.id)
+        .outerjoin(JobPosting, Lead.job_posting_id == JobPosting.id)
+        .outerjoin(_PostingCompany, JobPosting.company_id == _PostingCompany.id)
+    )
+    # Ids are assigned in insertion order, so ordering (and paging) by id is
+    # creation order without a sort: status lists run oldest-first like
+    # repository.get_leads_by_status(), the unfiltered list newest-first.
+    if status:
+        stmt = stmt.filter(Lead.status == status)
+        if cursor is not None:
+            stmt = stmt.filter(Lead.id > cursor)
+        return stmt.order_by(Lead.id.asc()).limit(limit)
+    if cursor is not None:
+        stmt = stmt.filter(Lead.id < cursor)
+    return stmt.order_by(Lead.id.desc()).limit(limit)
+
+
+def _row_to_lead_dict(row) -> dict:
+    posting = _nested(row, "posting_", _POSTING_FIELDS)
+    if posting is not None:
+        posting["company"] = _nested(row, "posting_company_", _COMPANY_FIELDS)
+    return {
+        **{f: getattr(row, f"lead_{f}") for f in _LEAD_FIELDS},
+        "company": _nested(row, "company_", _COMPANY_FIELDS),
+        "job_posting": posting,
+    }
+
+
+@router.get("/", response_model=list[LeadOut], summary="List leads", dependencies=[Depends(leads_etag)])
 def list_leads(
+    response: Response,
     status: Optional[LeadStatus] = Query(
         default=None,
         description="Filter by status. Omit to return all leads.",
     ),
     limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[int] = Query(
+        default=None,
+        description="Value of X-Next-Cursor from the previous page.",
+    ),
     db: Session = Depends(get_db),
 ):
     """
     Return a list of leads, optionally filtered by status.
     Leads include company and job posting details.
+
+    Keyset-paginated: when a page is full, the X-Next-Cursor response
+    header holds the cursor for the next one.
     """
-    if status:
-        leads = get_leads_by_status(db, status=status, limit=limit)
-    else:
-        leads = (
-            db.query(Lead)
-            .order_by(Lead.created_at.desc())
-            .limit(limit)
-            .all()
-        )
-    return leads
+    rows = db.execute(_lead_list_query(status, limit, cursor)).all()
+    if len(rows) == limit:
+        response.headers["X-Next-Cursor"] = str(rows[-1].lead_id)
+    leads = _LEADS_ADAPTER.validate_python([_row_to_lead_dict(row) for row in rows])
+    # Returning a Response skips FastAPI's second response_model validation;
+    # response_model stays on the decorator for the OpenAPI schema
+    return Response(
+        content=_LEADS_ADAPTER.dump_json(leads),
+        media_type="application/json",
+        headers=response.headers,
+    )
 
 
-@router.get("/stats", summary="Lead counts by status")
+@router.get("/stats", summary="Lead counts by status", dependencies=[Depends(leads_etag)])
 def lead_stats(db: Session = Depends(get_db)):
     """Return aggregate lead counts grouped by status."""
-    stats = {}
-    for status in LeadStatus:
-        count = db.query(Lead).filter(Lead.status == status).count()
+    # One GROUP BY round-trip; statuses with no leads still report 0
+    stats = {status.value: 0 for status in LeadStatus}
+    rows = db.query(Lead.status, func.count(Lead.id)).group_by(Lead.status).all()
+    for status, count in rows:
         stats[status.value] = count
     stats["total"] = sum(stats.values())
     return stats
@@ -61,7 +136,7 @@ def lead_stats(db: Session = Depends(get_db)):
 @router.get("/{lead_id}", response_model=LeadOut, summary="Get lead by ID")
 def get_lead(lead_id: int, db: Session = Depends(get_db)):
     """Fetch a single lead by its database ID, including company and job posting."""
-    lead = db.query(Lead).filter(Lead.id == lead_id).first()
+    lead = db.get(Lead, lead_id, options=LEAD_RELATIONS)
     if not lead:
         raise HTTPException(status_code=404, detail=f"Lead {lead_id} not found.")
     return lead
@@ -77,7 +152,7 @@ def patch_lead_status(
     Manually update the status of a lead.
     Valid statuses: new, qualified, emailed, replied, rejected.
     """
-    lead = db.query(Lead).filter(Lead.id == lead_id).first()
+    lead = db.get(Lead, lead_id, options=LEAD_RELATIONS)
     if not lead:
         raise HTTPException(status_code=404, detail=f"Lead {lead_id} not found.")
     update_lead_status(db, lead_id, payload.status)
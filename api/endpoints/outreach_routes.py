@@ -3,45 +3,57 @@ api/endpoints/outreach_routes.py — Routes for email outreach.
 
 POST /outreach/run            — Run outreach for all qualified leads
 POST /outreach/{lead_id}      — Send outreach for a specific lead
+GET  /outreach/{lead_id}/preview — Stream an AI draft for a lead (nothing sent)
 GET  /outreach/history         — List all email send attempts
 """
 
 import logging
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
-from app.db.models import Lead, LeadStatus, OutreachEmail
-from app.db.repository import get_leads_for_outreach, update_lead_status
+from app.db.models import DeliveryStatus, Lead, LeadStatus, OutreachEmail
+from app.db.repository import LEAD_RELATIONS, get_leads_for_outreach
 from app.config import settings
-from app.ai_engine.processor import draft_email
+from app.ai_engine.processor import adraft_email, astream_email_draft
 from app.outreach.templates import render_email
 from app.outreach.mailer import GmailMailer
+from app.services.outreach_service import (
+    adeliver_with_checkpoints,
+    draft_kwargs_for_lead,
+    record_deliveries,
+)
+from api.etag import outreach_history_etag
 from api.schemas import OutreachResult, OutreachEmailOut
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Built once: validates ORM rows and dumps JSON for /history in a single pass
+_HISTORY_ADAPTER = TypeAdapter(list[OutreachEmailOut])
 
-def _send_for_lead(lead: Lead, mailer: GmailMailer, db: Session) -> bool:
-    """Draft, render, and send (or dry-run) an email for a single lead."""
-    company = lead.company
-    posting = lead.job_posting
 
+def _get_lead(db: Session, lead_id: int) -> Lead | None:
+    return db.get(Lead, lead_id, options=LEAD_RELATIONS)
+
+
+async def _send_for_lead(lead: Lead, mailer: GmailMailer) -> dict | None:
+    """
+    Draft, render, and send (or dry-run) an email for a single lead.
+
+    Touches no DB: returns the mailer's delivery row for record_deliveries(),
+    or None if no email was attempted.
+    """
     try:
-        draft = draft_email(
-            company_name=company.name if company else "Unknown",
-            job_title=posting.title if posting else "Unknown",
-            job_description=(posting.description[:800] if posting else ""),
-            contact_role=lead.contact_role or "Engineering Leader",
-            company_pain_points=lead.company_pain_points or "[]",
-            reason=lead.reason or "",
-            product_description=settings.product_description,
-        )
+        draft = await adraft_email(**draft_kwargs_for_lead(lead))
     except Exception as exc:
         logger.error("LLM draft failed for lead %d: %s", lead.id, exc)
-        return False
+        return None
 
     rendered = render_email(
         subject=draft.subject,
@@ -53,27 +65,33 @@ def _send_for_lead(lead: Lead, mailer: GmailMailer, db: Session) -> bool:
     to_address = settings.gmail_user if settings.mailer_dry_run else None
     if not to_address:
         logger.warning("No recipient address for lead %d — skipping.", lead.id)
-        return False
+        return None
 
-    success = mailer.send(db=db, lead_id=lead.id, to_address=to_address, email=rendered)
-    if success:
-        update_lead_status(db, lead.id, LeadStatus.EMAILED)
-        db.commit()
-    return success
+    return await mailer.adeliver(lead.id, to_address, rendered)
+
+
+def _was_sent(delivery: dict | None) -> bool:
+    return delivery is not None and delivery["delivery_status"] == DeliveryStatus.SENT
 
 
 @router.post("/run", response_model=OutreachResult, summary="Run outreach for all qualified leads")
-def run_outreach(
+async def run_outreach(
     limit: int = Query(default=20, ge=1, le=100),
     dry_run: bool = Query(default=True, description="Print emails instead of sending"),
+    concurrency: Optional[int] = Query(
+        default=None, ge=1, le=32,
+        description="Leads drafted/sent in parallel (default: LLM_CONCURRENCY)",
+    ),
     db: Session = Depends(get_db),
 ):
     """
     Fetch all qualified-but-not-emailed leads, generate personalized emails
     via AI, and send them (or print in dry-run mode).
+    Up to `concurrency` leads are drafted and sent at the same time.
     """
-    mailer = GmailMailer(dry_run=dry_run)
-    leads = get_leads_for_outreach(db, limit=limit)
+    leads = await run_in_threadpool(
+        get_leads_for_outreach, db, limit=limit, min_score=settings.min_relevance_score,
+    )
 
     if not leads:
         return OutreachResult(
@@ -81,11 +99,22 @@ def run_outreach(
             message="No qualified leads pending outreach.",
         )
 
-    attempted = sent = failed = skipped = 0
-    for lead in leads:
-        attempted += 1
-        success = _send_for_lead(lead, mailer, db)
-        if success:
+    # One SMTP login for the whole batch instead of one per lead; outcomes are
+    # committed every OUTREACH_COMMIT_EVERY finished leads from a worker thread
+    async with GmailMailer(dry_run=dry_run) as mailer:
+        results = await adeliver_with_checkpoints(
+            db, leads,
+            lambda lead: _send_for_lead(lead, mailer),
+            concurrency or settings.llm_concurrency,
+        )
+
+    attempted = len(leads)
+    sent = failed = skipped = 0
+    for lead, result in zip(leads, results):
+        if isinstance(result, Exception):
+            logger.error("Outreach failed for lead %d: %s", lead.id, result)
+            failed += 1
+        elif _was_sent(result):
             sent += 1
         else:
             failed += 1
@@ -100,13 +129,13 @@ def run_outreach(
 
 
 @router.post("/{lead_id}", response_model=OutreachResult, summary="Send outreach for one lead")
-def outreach_single_lead(
+async def outreach_single_lead(
     lead_id: int,
     dry_run: bool = Query(default=True),
     db: Session = Depends(get_db),
 ):
     """Generate and send (or dry-run) an outreach email for a specific lead by ID."""
-    lead = db.query(Lead).filter(Lead.id == lead_id).first()
+    lead = await run_in_threadpool(_get_lead, db, lead_id)
     if not lead:
         raise HTTPException(status_code=404, detail=f"Lead {lead_id} not found.")
     if lead.status != LeadStatus.QUALIFIED:
@@ -114,8 +143,10 @@ def outreach_single_lead(
             status_code=400,
             detail=f"Lead {lead_id} has status '{lead.status.value}' — only QUALIFIED leads can be emailed.",
         )
-    mailer = GmailMailer(dry_run=dry_run)
-    success = _send_for_lead(lead, mailer, db)
+    delivery = await _send_for_lead(lead, GmailMailer(dry_run=dry_run))
+    if delivery is not None:
+        await run_in_threadpool(record_deliveries, db, [delivery])
+    success = _was_sent(delivery)
     return OutreachResult(
         attempted=1,
         sent=1 if success else 0,
@@ -125,16 +156,51 @@ def outreach_single_lead(
     )
 
 
-@router.get("/history", response_model=list[OutreachEmailOut], summary="Outreach email history")
+@router.get("/{lead_id}/preview", summary="Stream a draft email for one lead")
+async def preview_lead_email(lead_id: int, db: Session = Depends(get_db)):
+    """
+    Stream the AI-generated draft as plain text while the LLM writes it.
+    Nothing is sent, logged, or cached.
+    """
+    lead = await run_in_threadpool(_get_lead, db, lead_id)
+    if not lead:
+        raise HTTPException(status_code=404, detail=f"Lead {lead_id} not found.")
+    return StreamingResponse(
+        astream_email_draft(**draft_kwargs_for_lead(lead)),
+        media_type="text/plain",
+    )
+
+
+@router.get(
+    "/history",
+    response_model=list[OutreachEmailOut],
+    summary="Outreach email history",
+    dependencies=[Depends(outreach_history_etag)],
+)
 def outreach_history(
+    response: Response,
     limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[int] = Query(
+        default=None,
+        description="Value of X-Next-Cursor from the previous page.",
+    ),
     db: Session = Depends(get_db),
 ):
-    """Return all outreach email records (sent, failed, pending), most recent first."""
-    emails = (
-        db.query(OutreachEmail)
-        .order_by(OutreachEmail.id.desc())
-        .limit(limit)
-        .all()
+    """
+    Return all outreach email records (sent, failed, pending), most recent first.
+    Keyset-paginated by id — see X-Next-Cursor.
+    """
+    query = db.query(OutreachEmail)
+    if cursor is not None:
+        query = query.filter(OutreachEmail.id < cursor)
+    emails = query.order_by(OutreachEmail.id.desc()).limit(limit).all()
+    if len(emails) == limit:
+        response.headers["X-Next-Cursor"] = str(emails[-1].id)
+    # Returning a Response skips FastAPI's re-validation (see lead_routes.list_leads)
+    return Response(
+        content=_HISTORY_ADAPTER.dump_json(
+            _HISTORY_ADAPTER.validate_python(emails, from_attributes=True)
+        ),
+        media_type="application/json",
+        headers=response.headers,
     )
-    return emails
@@ -0,0 +1,42 @@
+"""
+api/etag.py — Conditional GET support for polled read endpoints.
+
+Each dependency fingerprints the underlying table with one small aggregate
+query. The ETag is a hash of that fingerprint plus the request's path and
+query string. If it matches the client's If-None-Match, the request ends
+with 304 Not Modified before the real query or any serialization runs.
+
+Usage:
+    @router.get("/", dependencies=[Depends(leads_etag)])
+"""
+
+import hashlib
+from typing import Callable
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.orm import Session
+
+from app.db.repository import leads_version, outreach_emails_version
+from app.db.session import get_db
+
+
+def _etag(request: Request, version: tuple) -> str:
+    payload = f"{request.url.path}?{request.url.query}|{version!r}"
+    return '"' + hashlib.md5(payload.encode("utf-8")).hexdigest() + '"'
+
+
+def _conditional(version_of: Callable[[Session], tuple]):
+    """Build a dependency that answers 304 when the table hasn't changed."""
+
+    def dependency(request: Request, response: Response, db: Session = Depends(get_db)) -> None:
+        tag = _etag(request, tuple(version_of(db)))
+        headers = {"ETag": tag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == tag:
+            raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        response.headers.update(headers)
+
+    return dependency
+
+
+leads_etag = _conditional(leads_version)
+outreach_history_etag = _conditional(outreach_emails_version)
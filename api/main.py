@@ -8,6 +8,7 @@ Run with:
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
@@ -17,12 +18,17 @@ from app.db.models import Base
 
 # ── Lifespan ─────────────────────────────────────────────────────────────────
 
+def _ping_database() -> None:
+    with engine.connect() as conn:
+        conn.execute(__import__("sqlalchemy").text("SELECT 1"))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup / shutdown logic."""
     try:
-        with engine.connect() as conn:
-            conn.execute(__import__("sqlalchemy").text("SELECT 1"))
+        # Off the event loop — an unreachable DB can hang for the connect timeout
+        await run_in_threadpool(_ping_database)
         print("✅ Database connection verified.")
     except Exception as exc:
         # Non-fatal: warn but don't crash — individual routes will handle DB errors
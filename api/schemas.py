@@ -36,6 +36,15 @@ class IngestionResult(BaseModel):
     message: str
 
 
+class IngestionJobOut(BaseModel):
+    """A background ingestion run — poll until status is completed/failed."""
+    job_id: str
+    status: str                                  # queued | running | completed | failed
+    created_at: datetime
+    result: Optional[IngestionResult] = None     # set when completed
+    error: Optional[str] = None                  # set when failed
+
+
 # ── Company ───────────────────────────────────────────────────────────────────
 
 class CompanyOut(BaseModel):
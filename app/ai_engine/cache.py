@@ -0,0 +1,73 @@
+"""
+app/ai_engine/cache.py — Disk-backed cache for LLM responses.
+
+Re-running qualification or drafting on the same inputs (retries, backfills,
+dev iteration) returns the stored result instead of paying for another LLM
+call. Entries live in a diskcache store under settings.llm_cache_dir, so
+they survive process restarts and are shared between the API and CLI scripts.
+
+Provides:
+  - make_key() : SHA-256 key for a namespace + model + temperature + prompt inputs
+  - lookup()   : cached value or None
+  - store()    : save a JSON-serializable value with the configured TTL
+"""
+
+import hashlib
+import json
+import logging
+from functools import lru_cache
+from typing import Any
+
+import diskcache
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _get_cache() -> diskcache.Cache:
+    """Open the cache directory on first use (not at import time)."""
+    return diskcache.Cache(settings.llm_cache_dir)
+
+
+def make_key(namespace: str, inputs: dict[str, Any], temperature: float) -> str:
+    """
+    Build a stable cache key from a namespace (e.g. "qualify"), the configured
+    model, the sampling temperature, and the prompt inputs.
+
+    Switching OPENROUTER_MODEL or a chain's temperature therefore starts from
+    a cold cache instead of serving answers produced under other settings.
+    """
+    payload = json.dumps(
+        {
+            "ns": namespace,
+            "model": settings.openrouter_model,
+            "t": temperature,
+            "inputs": inputs,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def lookup(key: str) -> Any | None:
+    """Return the cached value for key, or None on a miss / when caching is disabled."""
+    if not settings.llm_cache_enabled:
+        return None
+    try:
+        return _get_cache().get(key)
+    except Exception as exc:
+        # A broken cache must never break the pipeline — fall through to the LLM
+        logger.warning("LLM cache read failed: %s", exc)
+        return None
+
+
+def store(key: str, value: Any) -> None:
+    """Cache value under key for settings.llm_cache_ttl_seconds (no-op when disabled)."""
+    if not settings.llm_cache_enabled:
+        return
+    try:
+        _get_cache().set(key, value, expire=settings.llm_cache_ttl_seconds)
+    except Exception as exc:
+        logger.warning("LLM cache write failed: %s", exc)
@@ -1,29 +1,54 @@
 """
 app/ai_engine/processor.py — LangChain chain implementations for the AI engine.
 
-Three public functions:
+Three public functions, each with an async twin (a-prefixed) for use
+inside the FastAPI event loop:
   generate_keywords(product_description)  → list[str]
   qualify_lead(job_posting, product)      → QualificationResult
   draft_email(lead_data, product)         → EmailDraft
+
+plus qualify_leads_batch() / aqualify_leads_batch(), which qualify several
+postings in one LLM request, and astream_email_draft(), which yields draft
+text chunks for previews.
 """
 
+import hashlib
 import json
 import logging
-from dataclasses import dataclass
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
+from typing import Any
 
+from app.ai_engine import cache
 from app.ai_engine.prompt_templates import (
     EMAIL_DRAFT_PROMPT,
     KEYWORD_GENERATION_PROMPT,
+    LEAD_QUALIFICATION_BATCH_PROMPT,
     LEAD_QUALIFICATION_PROMPT,
 )
-from app.ai_engine.utils import build_openrouter_llm, parse_json_safely, truncate_for_context
+from app.ai_engine.utils import (
+    build_openrouter_llm,
+    gather_bounded,
+    parse_json_safely,
+    truncate_for_context,
+)
+from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Provider-side JSON mode: the model must emit one syntactically valid JSON
+# object. Only used for the object-shaped prompts (keywords return an array).
+JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+# Sampling temperatures per chain (also part of the response-cache key)
+KEYWORD_TEMPERATURE = 0.2
+QUALIFICATION_TEMPERATURE = 0.1   # low temp for consistent scoring
+EMAIL_TEMPERATURE = 0.7           # higher temp for natural-sounding copy
+
 
 # ── Output dataclasses ────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True)
 class QualificationResult:
     is_qualified: bool
     relevance_score: float          # 0.0 – 100.0
@@ -33,15 +58,67 @@ class QualificationResult:
     raw_response: str               # original LLM text (for debugging)
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailDraft:
     subject: str
     body: str
     raw_response: str               # original LLM text (for debugging)
 
 
+def _response_text(response: Any) -> str:
+    """Extract the text payload from a LangChain message (or anything else)."""
+    return response.content if hasattr(response, "content") else str(response)
+
+
 # ── 1. Keyword Generation ─────────────────────────────────────────────────────
 
+# Keywords only change when the product description does, so each description
+# is sent to the LLM once per process. Keyed on a SHA-256 of the description.
+# Behind it sits the on-disk LLM cache, so CLI runs skip the call after a restart.
+_KEYWORD_CACHE: dict[str, tuple[str, ...]] = {}
+
+
+def _keyword_cache_key(product_description: str) -> str:
+    return hashlib.sha256(product_description.encode("utf-8")).hexdigest()
+
+
+def _keyword_disk_key(product_description: str) -> str:
+    return cache.make_key("keywords", {"product_description": product_description}, KEYWORD_TEMPERATURE)
+
+
+def _cached_keywords(product_description: str) -> list[str] | None:
+    """Keywords from the in-process cache, else the disk cache; None on a miss."""
+    key = _keyword_cache_key(product_description)
+    if key not in _KEYWORD_CACHE:
+        cached = cache.lookup(_keyword_disk_key(product_description))
+        if cached is None:
+            return None
+        _KEYWORD_CACHE[key] = tuple(cached)
+    return list(_KEYWORD_CACHE[key])
+
+
+def _remember_keywords(product_description: str, keywords: list[str]) -> None:
+    _KEYWORD_CACHE[_keyword_cache_key(product_description)] = tuple(keywords)
+    cache.store(_keyword_disk_key(product_description), keywords)
+
+
+def _keyword_chain():
+    llm = build_openrouter_llm(temperature=KEYWORD_TEMPERATURE)
+    return KEYWORD_GENERATION_PROMPT | llm
+
+
+def _parse_keywords(raw_text: str) -> list[str]:
+    parsed = parse_json_safely(raw_text)
+
+    if not isinstance(parsed, list):
+        logger.error("Keyword generation returned non-list: %s", raw_text[:200])
+        raise ValueError(f"Expected a JSON array of strings, got: {type(parsed)}")
+
+    keywords = [str(k).lower().strip() for k in parsed if k]
+    logger.info("Generated %d keywords: %s", len(keywords), keywords[:5])
+    return keywords
+
+
 def generate_keywords(product_description: str) -> list[str]:
     """
     Generate B2B buyer-signal role keywords for the given product.
@@ -55,75 +132,85 @@ def generate_keywords(product_description: str) -> list[str]:
     Raises:
         ValueError: If the LLM returns an unparseable response.
     """
-    llm = build_openrouter_llm(temperature=0.2)
-    chain = KEYWORD_GENERATION_PROMPT | llm
+    cached = _cached_keywords(product_description)
+    if cached is not None:
+        return cached
 
+    chain = _keyword_chain()
     logger.info("Generating role keywords for product: %s...", product_description[:60])
 
     response = chain.invoke({"product_description": product_description})
-    raw_text = response.content if hasattr(response, "content") else str(response)
+    keywords = _parse_keywords(_response_text(response))
+    _remember_keywords(product_description, keywords)
+    return keywords
 
-    parsed = parse_json_safely(raw_text)
 
-    if not isinstance(parsed, list):
-        logger.error("Keyword generation returned non-list: %s", raw_text[:200])
-        raise ValueError(f"Expected a JSON array of strings, got: {type(parsed)}")
+async def agenerate_keywords(product_description: str) -> list[str]:
+    """Async version of generate_keywords() — shares the same caches."""
+    cached = _cached_keywords(product_description)
+    if cached is not None:
+        return cached
 
-    keywords = [str(k).lower().strip() for k in parsed if k]
-    logger.info("Generated %d keywords: %s", len(keywords), keywords[:5])
+    chain = _keyword_chain()
+    logger.info("Generating role keywords for product: %s...", product_description[:60])
+
+    response = await chain.ainvoke({"product_description": product_description})
+    keywords = _parse_keywords(_response_text(response))
+    _remember_keywords(product_description, keywords)
     return keywords
 
 
 # ── 2. Lead Qualification ─────────────────────────────────────────────────────
 
-def qualify_lead(
+def _qualification_chain():
+    llm = build_openrouter_llm(temperature=QUALIFICATION_TEMPERATURE)
+    return LEAD_QUALIFICATION_PROMPT | llm.bind(response_format=JSON_OBJECT_FORMAT)
+
+
+def _qualification_inputs(
     company_name: str,
     job_title: str,
     job_description: str,
     location: str,
     product_description: str,
-) -> QualificationResult:
-    """
-    Use the LLM to determine if a job posting signals a potential customer.
-
-    Args:
-        company_name:        Name of the hiring company.
-        job_title:           The job title from the posting.
-        job_description:     Full or truncated job description (plain text).
-        location:            Job location string.
-        product_description: Our product description.
-
-    Returns:
-        QualificationResult with score, reason, contact role, and pain points.
-    """
-    llm = build_openrouter_llm(temperature=0.1)  # low temp for consistent scoring
-    chain = LEAD_QUALIFICATION_PROMPT | llm
-
-    logger.info("Qualifying lead: %s @ %s", job_title, company_name)
-
-    response = chain.invoke({
+) -> dict[str, str]:
+    return {
         "product_description": product_description,
         "company_name": company_name,
         "job_title": job_title,
         "location": location or "Remote",
         "job_description": truncate_for_context(job_description, max_chars=2000),
-    })
-    raw_text = response.content if hasattr(response, "content") else str(response)
+    }
+
 
+def _unparseable_qualification(raw_text: str) -> QualificationResult:
+    """Safe default — mark as not qualified."""
+    return QualificationResult(
+        is_qualified=False,
+        relevance_score=0.0,
+        reason="LLM returned unparseable response.",
+        target_contact_role="Unknown",
+        company_pain_points=[],
+        raw_response=raw_text,
+    )
+
+
+def _parse_qualification(
+    raw_text: str, company_name: str, job_title: str,
+) -> QualificationResult | None:
+    """Parse the LLM output; None if it isn't a JSON object."""
     parsed = parse_json_safely(raw_text)
 
     if not isinstance(parsed, dict):
         logger.error("Qualification returned non-dict for %s: %s", company_name, raw_text[:200])
-        # Return a safe default — mark as not qualified
-        return QualificationResult(
-            is_qualified=False,
-            relevance_score=0.0,
-            reason="LLM returned unparseable response.",
-            target_contact_role="Unknown",
-            company_pain_points=[],
-            raw_response=raw_text,
-        )
+        return None
+
+    return _qualification_from_dict(parsed, raw_text, company_name, job_title)
 
+
+def _qualification_from_dict(
+    parsed: dict, raw_text: str, company_name: str, job_title: str,
+) -> QualificationResult:
     pain_points = parsed.get("company_pain_points", [])
     if not isinstance(pain_points, list):
         pain_points = []
@@ -144,8 +231,275 @@ def qualify_lead(
     return result
 
 
+def qualify_lead(
+    company_name: str,
+    job_title: str,
+    job_description: str,
+    location: str,
+    product_description: str,
+) -> QualificationResult:
+    """
+    Use the LLM to determine if a job posting signals a potential customer.
+
+    Args:
+        company_name:        Name of the hiring company.
+        job_title:           The job title from the posting.
+        job_description:     Full or truncated job description (plain text).
+        location:            Job location string.
+        product_description: Our product description.
+
+    Returns:
+        QualificationResult with score, reason, contact role, and pain points.
+    """
+    inputs = _qualification_inputs(
+        company_name, job_title, job_description, location, product_description,
+    )
+    key = cache.make_key("qualify", inputs, QUALIFICATION_TEMPERATURE)
+    cached = cache.lookup(key)
+    if cached is not None:
+        logger.info("Qualification cache hit: %s @ %s", job_title, company_name)
+        return QualificationResult(**cached)
+
+    chain = _qualification_chain()
+    logger.info("Qualifying lead: %s @ %s", job_title, company_name)
+
+    raw_text = _response_text(chain.invoke(inputs))
+    result = _parse_qualification(raw_text, company_name, job_title)
+    if result is None:
+        return _unparseable_qualification(raw_text)
+    cache.store(key, asdict(result))
+    return result
+
+
+async def aqualify_lead(
+    company_name: str,
+    job_title: str,
+    job_description: str,
+    location: str,
+    product_description: str,
+) -> QualificationResult:
+    """Async version of qualify_lead() — same arguments, result, and cache."""
+    inputs = _qualification_inputs(
+        company_name, job_title, job_description, location, product_description,
+    )
+    key = cache.make_key("qualify", inputs, QUALIFICATION_TEMPERATURE)
+    cached = cache.lookup(key)
+    if cached is not None:
+        logger.info("Qualification cache hit: %s @ %s", job_title, company_name)
+        return QualificationResult(**cached)
+
+    chain = _qualification_chain()
+    logger.info("Qualifying lead: %s @ %s", job_title, company_name)
+
+    raw_text = _response_text(await chain.ainvoke(inputs))
+    result = _parse_qualification(raw_text, company_name, job_title)
+    if result is None:
+        return _unparseable_qualification(raw_text)
+    cache.store(key, asdict(result))
+    return result
+
+
+# ── 2b. Batched Lead Qualification ────────────────────────────────────────────
+
+def _batch_qualification_chain():
+    llm = build_openrouter_llm(temperature=QUALIFICATION_TEMPERATURE)
+    return LEAD_QUALIFICATION_BATCH_PROMPT | llm.bind(response_format=JSON_OBJECT_FORMAT)
+
+
+def _batch_prompt_inputs(product_description: str, batch: list[dict[str, str]]) -> dict[str, str]:
+    """Render a batch as the JSON array the batch prompt expects (id = position)."""
+    postings = [
+        {
+            "id": position,
+            "company": inputs["company_name"],
+            "job_title": inputs["job_title"],
+            "location": inputs["location"],
+            "description": inputs["job_description"],
+        }
+        for position, inputs in enumerate(batch)
+    ]
+    return {
+        "product_description": product_description,
+        "job_postings": json.dumps(postings, indent=2, ensure_ascii=False),
+    }
+
+
+def _parse_batch_qualifications(
+    raw_text: str, batch: list[dict[str, str]],
+) -> dict[int, QualificationResult]:
+    """Map batch positions to parsed results; positions the LLM skipped are absent."""
+    parsed = parse_json_safely(raw_text)
+    entries = parsed.get("results") if isinstance(parsed, dict) else parsed
+
+    if not isinstance(entries, list):
+        logger.error("Batch qualification returned no results list: %s", raw_text[:200])
+        return {}
+
+    results: dict[int, QualificationResult] = {}
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            position = int(entry.get("id"))
+        except (TypeError, ValueError):
+            continue
+        if 0 <= position < len(batch) and position not in results:
+            inputs = batch[position]
+            results[position] = _qualification_from_dict(
+                entry, json.dumps(entry), inputs["company_name"], inputs["job_title"],
+            )
+    return results
+
+
+def _batch_lookup(
+    jobs: list[dict[str, str]], product_description: str,
+) -> tuple[list[dict[str, str]], list[str], list[QualificationResult | None]]:
+    """Prompt inputs, cache keys, and cached results (None = miss) for each job."""
+    inputs = [
+        _qualification_inputs(product_description=product_description, **job) for job in jobs
+    ]
+    keys = [cache.make_key("qualify", item, QUALIFICATION_TEMPERATURE) for item in inputs]
+    results = []
+    for key in keys:
+        cached = cache.lookup(key)
+        results.append(QualificationResult(**cached) if cached is not None else None)
+    return inputs, keys, results
+
+
+def _store_batch_results(
+    raw_text: str,
+    inputs: list[dict[str, str]],
+    keys: list[str],
+    results: list[QualificationResult | None],
+    pending: list[int],
+) -> None:
+    """Fill results in place from one batch response and cache each answer."""
+    answered = _parse_batch_qualifications(raw_text, [inputs[i] for i in pending])
+    for position, result in answered.items():
+        index = pending[position]
+        results[index] = result
+        cache.store(keys[index], asdict(result))
+    if len(answered) < len(pending):
+        logger.warning(
+            "Batch qualification answered %d of %d postings; retrying the rest one by one.",
+            len(answered), len(pending),
+        )
+
+
+def qualify_leads_batch(
+    jobs: list[dict[str, str]],
+    product_description: str,
+) -> list[QualificationResult]:
+    """
+    Qualify several job postings with a single LLM request.
+
+    Args:
+        jobs:                One dict per posting with company_name, job_title,
+                             job_description and location (as for qualify_lead()).
+        product_description: Our product description (shared by the whole batch).
+
+    Returns:
+        One QualificationResult per job, in input order. Cached postings are
+        not re-sent; postings missing from the batch answer fall back to
+        qualify_lead().
+    """
+    inputs, keys, results = _batch_lookup(jobs, product_description)
+    pending = [i for i, result in enumerate(results) if result is None]
+
+    if len(pending) > 1:
+        chain = _batch_qualification_chain()
+        logger.info("Qualifying %d leads in one batch request", len(pending))
+        response = chain.invoke(
+            _batch_prompt_inputs(product_description, [inputs[i] for i in pending])
+        )
+        _store_batch_results(_response_text(response), inputs, keys, results, pending)
+
+    for i, result in enumerate(results):
+        if result is None:
+            results[i] = qualify_lead(product_description=product_description, **jobs[i])
+    return results
+
+
+async def aqualify_leads_batch(
+    jobs: list[dict[str, str]],
+    product_description: str,
+) -> list[QualificationResult]:
+    """Async version of qualify_leads_batch() — same arguments, result, and cache."""
+    inputs, keys, results = _batch_lookup(jobs, product_description)
+    pending = [i for i, result in enumerate(results) if result is None]
+
+    if len(pending) > 1:
+        chain = _batch_qualification_chain()
+        logger.info("Qualifying %d leads in one batch request", len(pending))
+        response = await chain.ainvoke(
+            _batch_prompt_inputs(product_description, [inputs[i] for i in pending])
+        )
+        _store_batch_results(_response_text(response), inputs, keys, results, pending)
+
+    missing = [i for i, result in enumerate(results) if result is None]
+    singles = await gather_bounded(
+        (aqualify_lead(product_description=product_description, **jobs[i]) for i in missing),
+        settings.llm_concurrency,
+    )
+    for i, result in zip(missing, singles):
+        results[i] = result
+    return results
+
+
 # ── 3. Email Draft ────────────────────────────────────────────────────────────
 
+def _email_chain():
+    llm = build_openrouter_llm(temperature=EMAIL_TEMPERATURE)
+    return EMAIL_DRAFT_PROMPT | llm.bind(response_format=JSON_OBJECT_FORMAT)
+
+
+def _email_inputs(
+    company_name: str,
+    job_title: str,
+    contact_role: str,
+    reason: str,
+    pain_points: list[str],
+    product_description: str,
+) -> dict[str, str]:
+    pain_points_str = "\n".join(f"- {p}" for p in pain_points) if pain_points else "Not specified"
+    return {
+        "product_description": product_description,
+        "company_name": company_name,
+        "job_title": job_title,
+        "contact_role": contact_role,
+        "reason": reason,
+        "pain_points": pain_points_str,
+    }
+
+
+def _fallback_email_draft(raw_text: str, company_name: str, job_title: str) -> EmailDraft:
+    """Safe fallback draft used when the LLM output can't be parsed."""
+    return EmailDraft(
+        subject=f"Quick question about your {job_title} role",
+        body=(
+            f"Hi,\n\nI came across {company_name}'s recent {job_title} posting "
+            f"and thought our product might be relevant to what your team is building.\n\n"
+            f"Would you be open to a quick 15-minute chat?\n\nBest"
+        ),
+        raw_response=raw_text,
+    )
+
+
+def _parse_email_draft(raw_text: str, company_name: str) -> EmailDraft | None:
+    """Parse the LLM output; None if it lacks a subject and body."""
+    parsed = parse_json_safely(raw_text)
+
+    if not isinstance(parsed, dict) or "subject" not in parsed or "body" not in parsed:
+        logger.error("Email draft returned invalid structure for %s: %s", company_name, raw_text[:200])
+        return None
+
+    return EmailDraft(
+        subject=str(parsed["subject"]),
+        body=str(parsed["body"]),
+        raw_response=raw_text,
+    )
+
+
 def draft_email(
     company_name: str,
     job_title: str,
@@ -168,40 +522,75 @@ def draft_email(
     Returns:
         EmailDraft with subject and body.
     """
-    llm = build_openrouter_llm(temperature=0.7)  # higher temp for natural-sounding copy
-    chain = EMAIL_DRAFT_PROMPT | llm
+    inputs = _email_inputs(
+        company_name, job_title, contact_role, reason, pain_points, product_description,
+    )
+    key = cache.make_key("draft", inputs, EMAIL_TEMPERATURE)
+    cached = cache.lookup(key)
+    if cached is not None:
+        logger.info("Email draft cache hit: %s", company_name)
+        return EmailDraft(**cached)
 
+    chain = _email_chain()
     logger.info("Drafting email for: %s (contact: %s)", company_name, contact_role)
 
-    pain_points_str = "\n".join(f"- {p}" for p in pain_points) if pain_points else "Not specified"
+    raw_text = _response_text(chain.invoke(inputs))
+    draft = _parse_email_draft(raw_text, company_name)
+    if draft is None:
+        return _fallback_email_draft(raw_text, company_name, job_title)
+    cache.store(key, asdict(draft))
+    return draft
 
-    response = chain.invoke({
-        "product_description": product_description,
-        "company_name": company_name,
-        "job_title": job_title,
-        "contact_role": contact_role,
-        "reason": reason,
-        "pain_points": pain_points_str,
-    })
-    raw_text = response.content if hasattr(response, "content") else str(response)
 
-    parsed = parse_json_safely(raw_text)
+async def adraft_email(
+    company_name: str,
+    job_title: str,
+    contact_role: str,
+    reason: str,
+    pain_points: list[str],
+    product_description: str,
+) -> EmailDraft:
+    """Async version of draft_email() — same arguments, result, and cache."""
+    inputs = _email_inputs(
+        company_name, job_title, contact_role, reason, pain_points, product_description,
+    )
+    key = cache.make_key("draft", inputs, EMAIL_TEMPERATURE)
+    cached = cache.lookup(key)
+    if cached is not None:
+        logger.info("Email draft cache hit: %s", company_name)
+        return EmailDraft(**cached)
 
-    if not isinstance(parsed, dict) or "subject" not in parsed or "body" not in parsed:
-        logger.error("Email draft returned invalid structure for %s: %s", company_name, raw_text[:200])
-        # Safe fallback draft
-        return EmailDraft(
-            subject=f"Quick question about your {job_title} role",
-            body=(
-                f"Hi,\n\nI came across {company_name}'s recent {job_title} posting "
-                f"and thought our product might be relevant to what your team is building.\n\n"
-                f"Would you be open to a quick 15-minute chat?\n\nBest"
-            ),
-            raw_response=raw_text,
-        )
+    chain = _email_chain()
+    logger.info("Drafting email for: %s (contact: %s)", company_name, contact_role)
 
-    return EmailDraft(
-        subject=str(parsed["subject"]),
-        body=str(parsed["body"]),
-        raw_response=raw_text,
-    )
+    raw_text = _response_text(await chain.ainvoke(inputs))
+    draft = _parse_email_draft(raw_text, company_name)
+    if draft is None:
+        return _fallback_email_draft(raw_text, company_name, job_title)
+    cache.store(key, asdict(draft))
+    return draft
+
+
+async def astream_email_draft(
+    company_name: str,
+    job_title: str,
+    contact_role: str,
+    reason: str,
+    pain_points: list[str],
+    product_description: str,
+) -> AsyncIterator[str]:
+    """
+    Stream the raw LLM draft text as it is generated, for live previews.
+
+    Same arguments as draft_email(). Output is the unparsed model text
+    (normally the JSON draft) and is neither parsed nor cached.
+    """
+    chain = _email_chain()
+    logger.info("Streaming email draft for: %s (contact: %s)", company_name, contact_role)
+
+    async for chunk in chain.astream(_email_inputs(
+        company_name, job_title, contact_role, reason, pain_points, product_description,
+    )):
+        text = _response_text(chunk)
+        if text:
+            yield text
@@ -4,9 +4,12 @@ app/ai_engine/prompt_templates.py — All LangChain prompt templates for the AI
 Three prompt chains:
   1. KEYWORD_GENERATION  — product description → list of buyer-signal role keywords
   2. LEAD_QUALIFICATION  — job posting + product → structured qualification JSON
+     (LEAD_QUALIFICATION_BATCH: several postings → one result per posting id)
   3. EMAIL_DRAFT         — lead context → personalized cold outreach email
 """
 
+import textwrap
+
 from langchain_core.prompts import ChatPromptTemplate
 
 
@@ -45,47 +48,94 @@ Example output format:
 
 # ── 2. Lead Qualification ─────────────────────────────────────────────────────
 
+# Everything that is identical for every posting in a run (role, product,
+# instructions, output schema) lives in the system message, marked with a
+# prompt-caching breakpoint; the per-posting text follows in the human message
+# so providers that support caching (e.g. Anthropic via OpenRouter) can reuse
+# the prefix. Providers without prompt caching ignore the marker.
+CACHE_BREAKPOINT = {"type": "ephemeral"}
+
+_QUALIFICATION_ROLE = """You are an expert B2B lead qualification analyst. \
+You analyze job postings and company context to identify potential customers \
+for a given product. Be analytical, concise, and realistic in your scoring.
+
+PRODUCT DESCRIPTION:
+{product_description}
+
+INSTRUCTIONS:
+For each job posting you receive, determine if the company is likely to need and buy our product based on the job posting context.
+Consider: company size signals, tech stack, team structure, growth stage, and the job role's pain points.
+"""
+
+_QUALIFICATION_FIELDS = """  "is_qualified": true or false,
+  "relevance_score": <integer 0-100>,
+  "reason": "<1-2 sentence explanation of why they are or aren't a good lead>",
+  "target_contact_role": "<ideal job title to reach out to at this company>",
+  "company_pain_points": ["<pain point 1>", "<pain point 2>", "<pain point 3>"]"""
+
+_SCORING_GUIDE = """
+Scoring guide:
+- 80-100: Strong signal — company clearly needs this product
+- 60-79:  Good lead — reasonable fit with potential
+- 40-59:  Weak lead — marginal fit, include if score threshold allows
+- 0-39:   Not qualified — poor fit, set is_qualified to false
+"""
+
 LEAD_QUALIFICATION_PROMPT = ChatPromptTemplate.from_messages([
     (
         "system",
-        (
-            "You are an expert B2B lead qualification analyst. "
-            "You analyze job postings and company context to identify potential customers "
-            "for a given product. Be analytical, concise, and realistic in your scoring."
-        ),
+        [{
+            "type": "text",
+            "cache_control": CACHE_BREAKPOINT,
+            "text": _QUALIFICATION_ROLE + """
+Return ONLY a valid JSON object with exactly these fields:
+{{
+""" + _QUALIFICATION_FIELDS + """
+}}
+""" + _SCORING_GUIDE,
+        }],
     ),
     (
         "human",
         """Analyze whether this company is a potential customer for our product.
 
-PRODUCT DESCRIPTION:
-{product_description}
-
 JOB POSTING:
 Company: {company_name}
 Job Title: {job_title}
 Location: {location}
 Description:
 {job_description}
+""",
+    ),
+])
 
-INSTRUCTIONS:
-Determine if this company is likely to need and buy our product based on the job posting context.
-Consider: company size signals, tech stack, team structure, growth stage, and the job role's pain points.
-
-Return ONLY a valid JSON object with exactly these fields:
+# Several postings in one request — same analysis, one result per posting id
+LEAD_QUALIFICATION_BATCH_PROMPT = ChatPromptTemplate.from_messages([
+    (
+        "system",
+        [{
+            "type": "text",
+            "cache_control": CACHE_BREAKPOINT,
+            "text": _QUALIFICATION_ROLE + """
+You will receive a JSON array of job postings, each with an integer "id".
+Return ONLY a valid JSON object with one result per posting, in this shape:
 {{
-  "is_qualified": true or false,
-  "relevance_score": <integer 0-100>,
-  "reason": "<1-2 sentence explanation of why they are or aren't a good lead>",
-  "target_contact_role": "<ideal job title to reach out to at this company>",
-  "company_pain_points": ["<pain point 1>", "<pain point 2>", "<pain point 3>"]
+  "results": [
+    {{
+      "id": <the posting's id>,
+""" + textwrap.indent(_QUALIFICATION_FIELDS, "    ") + """
+    }}
+  ]
 }}
+""" + _SCORING_GUIDE,
+        }],
+    ),
+    (
+        "human",
+        """Analyze whether each of these companies is a potential customer for our product.
 
-Scoring guide:
-- 80-100: Strong signal — company clearly needs this product
-- 60-79:  Good lead — reasonable fit with potential
-- 40-59:  Weak lead — marginal fit, include if score threshold allows
-- 0-39:   Not qualified — poor fit, set is_qualified to false
+JOB POSTINGS:
+{job_postings}
 """,
     ),
 ])
@@ -96,27 +146,17 @@ Scoring guide:
 EMAIL_DRAFT_PROMPT = ChatPromptTemplate.from_messages([
     (
         "system",
-        (
-            "You are an expert cold outreach copywriter specializing in B2B SaaS. "
-            "You write short, personalized, and compelling cold emails that get replies. "
-            "Never use hollow phrases like 'I hope this email finds you well' or 'synergy'. "
-            "Write like a real person, not a marketing bot."
-        ),
-    ),
-    (
-        "human",
-        """Write a personalized cold outreach email for the following lead.
+        [{
+            "type": "text",
+            "cache_control": CACHE_BREAKPOINT,
+            "text": """You are an expert cold outreach copywriter specializing in B2B SaaS. \
+You write short, personalized, and compelling cold emails that get replies. \
+Never use hollow phrases like 'I hope this email finds you well' or 'synergy'. \
+Write like a real person, not a marketing bot.
 
 OUR PRODUCT:
 {product_description}
 
-LEAD CONTEXT:
-Company: {company_name}
-Job Title Seen: {job_title}
-Target Contact Role: {contact_role}
-Why They're A Good Fit: {reason}
-Company Pain Points: {pain_points}
-
 REQUIREMENTS:
 - Subject line: short, specific, no clickbait (max 8 words)
 - Email body: 4-6 sentences max, conversational tone
@@ -130,6 +170,19 @@ Return ONLY a valid JSON object with exactly these two fields:
   "subject": "<email subject line>",
   "body": "<email body as plain text, use \\n for line breaks>"
 }}
+""",
+        }],
+    ),
+    (
+        "human",
+        """Write a personalized cold outreach email for the following lead.
+
+LEAD CONTEXT:
+Company: {company_name}
+Job Title Seen: {job_title}
+Target Contact Role: {contact_role}
+Why They're A Good Fit: {reason}
+Company Pain Points: {pain_points}
 """,
     ),
 ])
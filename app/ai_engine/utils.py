@@ -5,34 +5,49 @@ Provides:
   - build_openrouter_llm()  : factory for the LangChain-compatible OpenRouter LLM
   - parse_json_safely()     : robust JSON extraction from messy LLM text
   - truncate_for_context()  : safely trim long strings to fit LLM context window
+  - gather_bounded()        : asyncio.gather with at most N awaitables in flight
 """
 
-import json
+import asyncio
 import logging
 import re
-from typing import Any
+from collections.abc import Awaitable, Iterable
+from functools import lru_cache
+from typing import Any, TypeVar
 
+import orjson
 from langchain_openai import ChatOpenAI
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # OpenRouter's base URL (drop-in OpenAI-compatible API)
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 
+# Compiled once — parse_json_safely() runs on every LLM response
+_CODE_FENCE_RE = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+_JSON_ARRAY_RE = re.compile(r"\[[\s\S]*\]")
+
 
+@lru_cache(maxsize=8)
 def build_openrouter_llm(temperature: float = 0.3) -> ChatOpenAI:
     """
     Build a LangChain ChatOpenAI client pointed at OpenRouter.
 
+    Cached per temperature: every chain reuses one client (and its HTTP
+    connection pool) instead of constructing a new one on each call.
+
     Args:
         temperature: 0.0 = deterministic, 1.0 = creative.
                      Use low temp (0.1–0.3) for structured JSON outputs,
                      higher (0.6–0.8) for creative email drafting.
 
     Returns:
-        A LangChain-compatible LLM instance.
+        A LangChain-compatible LLM instance (shared — don't mutate it).
     """
     return ChatOpenAI(
         model=settings.openrouter_model,
@@ -48,6 +63,63 @@ def build_openrouter_llm(temperature: float = 0.3) -> ChatOpenAI:
     )
 
 
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+def _find_json_span(text: str, start: int = 0) -> tuple[int, str] | None:
+    """
+    Return (offset, span) for the first bracket-balanced {...} or [...] at or
+    after start, or None if there isn't one.
+
+    Linear scan; brackets inside string literals (including escaped quotes)
+    are ignored. The span is not validated — callers parse it.
+    """
+    begin = -1
+    stack: list[str] = []
+    in_string = False
+    escaped = False
+    i = start
+    while i < len(text):
+        ch = text[i]
+        if begin < 0:
+            if ch in _CLOSERS:
+                begin = i
+                stack.append(_CLOSERS[ch])
+        elif in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in _CLOSERS:
+            stack.append(_CLOSERS[ch])
+        elif ch in "}]":
+            if ch != stack[-1]:
+                # Mismatched closer — retry from just after this opening bracket
+                i, begin, stack = begin, -1, []
+            else:
+                stack.pop()
+                if not stack:
+                    return begin, text[begin:i + 1]
+        i += 1
+    return None
+
+
+def _strip_code_fence(text: str) -> str:
+    """Unwrap a response that is exactly one ```json ... ``` (or ``` ... ```) block."""
+    if not text.startswith("```"):
+        return text
+    body = text[3:]
+    if body[:4].lower() == "json":
+        body = body[4:]
+    if body.endswith("```"):
+        body = body[:-3]
+    return body.strip()
+
+
 def parse_json_safely(text: str) -> dict[str, Any] | list[Any] | None:
     """
     Robustly extract and parse a JSON object or array from LLM output.
@@ -62,23 +134,36 @@ def parse_json_safely(text: str) -> dict[str, Any] | list[Any] | None:
     if not text:
         return None
 
-    # Strip markdown code fences (```json ... ``` or ``` ... ```)
-    cleaned = re.sub(r"```(?:json)?\s*([\s\S]*?)```", r"\1", text.strip())
-    cleaned = cleaned.strip()
+    stripped = text.strip()
+    cleaned = _strip_code_fence(stripped)
 
-    # Try direct parse first
+    # Try direct parse first (orjson: same results as json.loads, parsed in C)
     try:
-        return json.loads(cleaned)
-    except json.JSONDecodeError:
+        return orjson.loads(cleaned)
+    except orjson.JSONDecodeError:
         pass
 
-    # Try to extract the first JSON object {...} or array [...]
-    for pattern in (r"\{[\s\S]*\}", r"\[[\s\S]*\]"):
-        match = re.search(pattern, cleaned)
+    # Fences somewhere inside surrounding prose — only then pay for the regex
+    if "```" in stripped:
+        cleaned = _CODE_FENCE_RE.sub(r"\1", stripped).strip()
+
+    # Scan for the first balanced {...} / [...] that is valid JSON, so trailing
+    # prose after the value (or a bogus {...} before it) doesn't break parsing
+    start = 0
+    while (span := _find_json_span(cleaned, start)) is not None:
+        offset, candidate = span
+        try:
+            return orjson.loads(candidate)
+        except orjson.JSONDecodeError:
+            start = offset + 1
+
+    # Last resort: greedy first-to-last bracket match
+    for pattern in (_JSON_OBJECT_RE, _JSON_ARRAY_RE):
+        match = pattern.search(cleaned)
         if match:
             try:
-                return json.loads(match.group())
-            except json.JSONDecodeError:
+                return orjson.loads(match.group())
+            except orjson.JSONDecodeError:
                 continue
 
     logger.warning("Could not parse JSON from LLM output: %s", text[:200])
@@ -93,3 +178,28 @@ def truncate_for_context(text: str, max_chars: int = 2000) -> str:
     if not text or len(text) <= max_chars:
         return text or ""
     return text[:max_chars] + "..."
+
+
+async def gather_bounded(
+    awaitables: Iterable[Awaitable[T]],
+    limit: int,
+    return_exceptions: bool = False,
+) -> list[T | BaseException]:
+    """
+    Await everything concurrently, with at most `limit` running at once.
+
+    LLM calls are network-bound, so overlapping them makes N calls take
+    about as long as N / limit sequential ones; the cap keeps us under the
+    provider's rate limits. Results come back in input order, as with
+    asyncio.gather().
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(
+        *(_bounded(awaitable) for awaitable in awaitables),
+        return_exceptions=return_exceptions,
+    )
@@ -22,6 +22,27 @@ class Settings(BaseSettings):
         description="OpenRouter model identifier",
     )
 
+    # ── LLM response cache ────────────────────────────────────────────────────
+    llm_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse stored LLM results for identical prompt inputs",
+    )
+    llm_cache_dir: str = Field(
+        default=".cache/llm",
+        description="Directory of the on-disk LLM response cache",
+    )
+    llm_cache_ttl_seconds: int = Field(
+        default=30 * 86400,
+        gt=0,
+        description="How long a cached LLM response stays valid (seconds)",
+    )
+    llm_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Max LLM requests in flight at once (qualification and drafting)",
+    )
+
     # ── Database ──────────────────────────────────────────────────────────────
     database_url: str = Field(..., description="PostgreSQL connection URI")
 
@@ -46,6 +67,12 @@ class Settings(BaseSettings):
         le=100,
         description="Minimum lead relevance score (0–100) to be considered qualified",
     )
+    qualification_batch_size: int = Field(
+        default=10,
+        ge=1,
+        le=50,
+        description="Job postings qualified per LLM request (1 = one request per posting)",
+    )
 
     # ── Ingestion ─────────────────────────────────────────────────────────────
     max_jobs_per_run: int = Field(
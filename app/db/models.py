@@ -19,6 +19,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -59,12 +60,17 @@ class Company(Base):
     domain = Column(String(255), nullable=True, unique=True)
     location = Column(String(255), nullable=True)
     website = Column(String(512), nullable=True)
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     job_postings = relationship("JobPosting", back_populates="company", cascade="all, delete-orphan")
     leads = relationship("Lead", back_populates="company", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # get_or_create_company(ies) falls back to an exact name match
+        Index("ix_companies_name", "name"),
+    )
+
     def __repr__(self) -> str:
         return f"<Company id={self.id} name={self.name!r}>"
 
@@ -78,14 +84,25 @@ class JobPosting(Base):
     description = Column(Text, nullable=True)
     url = Column(String(1024), nullable=True, unique=True)
     source = Column(String(100), nullable=False, default="remoteok")  # e.g. "remoteok"
-    posted_at = Column(DateTime, nullable=True)
+    posted_at = Column(DateTime(timezone=True), nullable=True)
     is_processed = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     company = relationship("Company", back_populates="job_postings")
     lead = relationship("Lead", back_populates="job_posting", uselist=False)
 
+    __table_args__ = (
+        # Qualification queue: WHERE is_processed = false ORDER BY created_at.
+        # Partial, so it only holds the (small) backlog, not every posting ever seen.
+        Index(
+            "ix_job_postings_unprocessed_created",
+            "created_at",
+            postgresql_where=(is_processed == False),  # noqa: E712
+            sqlite_where=(is_processed == False),  # noqa: E712
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<JobPosting id={self.id} title={self.title!r}>"
 
@@ -97,21 +114,26 @@ class Lead(Base):
     company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
     job_posting_id = Column(Integer, ForeignKey("job_postings.id", ondelete="SET NULL"), nullable=True)
 
-    status = Column(Enum(LeadStatus), default=LeadStatus.NEW, nullable=False)
+    status = Column(Enum(LeadStatus, native_enum=False, length=32), default=LeadStatus.NEW, nullable=False)
     relevance_score = Column(Float, nullable=True)        # 0.0 – 100.0
     ai_analysis = Column(Text, nullable=True)             # Raw LLM qualification JSON
     reason = Column(Text, nullable=True)                  # Human-readable qualification reason
     contact_role = Column(String(255), nullable=True)     # e.g. "CTO", "Head of Engineering"
     company_pain_points = Column(Text, nullable=True)     # JSON list stored as text
 
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
     company = relationship("Company", back_populates="leads")
     job_posting = relationship("JobPosting", back_populates="lead")
     outreach_emails = relationship("OutreachEmail", back_populates="lead", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Status-filtered lists / outreach queue, keyset-paginated by id
+        Index("ix_leads_status_id", "status", "id"),
+    )
+
     def __repr__(self) -> str:
         return f"<Lead id={self.id} status={self.status} score={self.relevance_score}>"
 
@@ -124,10 +146,10 @@ class OutreachEmail(Base):
     to_address = Column(String(255), nullable=True)       # may be unknown initially
     subject = Column(String(512), nullable=False)
     body = Column(Text, nullable=False)
-    delivery_status = Column(Enum(DeliveryStatus), default=DeliveryStatus.PENDING, nullable=False)
+    delivery_status = Column(Enum(DeliveryStatus, native_enum=False, length=32), default=DeliveryStatus.PENDING, nullable=False)
     error_message = Column(Text, nullable=True)
-    sent_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     # Relationships
     lead = relationship("Lead", back_populates="outreach_emails")
@@ -7,16 +7,23 @@ and easy to test/mock.
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session, joinedload
 
 from app.db.models import Company, DeliveryStatus, JobPosting, Lead, LeadStatus, OutreachEmail
 from app.ingestion.normalizer import NormalizedJob
 
 logger = logging.getLogger(__name__)
 
+# Relationships LeadOut serializes — load them up front instead of 2 lazy SELECTs
+# per lead. Both are many-to-one, so a LEFT JOIN fetches them in the same query
+# without multiplying rows (LIMIT stays correct).
+LEAD_RELATIONS = (joinedload(Lead.company), joinedload(Lead.job_posting))
+
 
 # ── Company ───────────────────────────────────────────────────────────────────
 
@@ -49,6 +56,80 @@ def get_or_create_company(db: Session, job: NormalizedJob) -> Company:
     return company
 
 
+CompanyKey = tuple[Optional[str], str]   # (company_domain, company_name)
+
+
+def get_or_create_companies(db: Session, jobs: list[NormalizedJob]) -> dict[CompanyKey, Company]:
+    """
+    Bulk version of get_or_create_company() for a whole ingestion batch.
+
+    Same matching rules (domain first, then exact name), but resolved with a
+    fixed handful of queries instead of up to three per job. New companies
+    with a domain are inserted with ON CONFLICT DO NOTHING, so a concurrent
+    run creating the same domain can't fail the batch.
+
+    Returns a mapping of (company_domain, company_name) → Company.
+    """
+    first_job: dict[CompanyKey, NormalizedJob] = {}
+    for job in jobs:
+        first_job.setdefault((job.company_domain, job.company_name), job)
+    if not first_job:
+        return {}
+
+    by_domain: dict[str, Company] = {}
+    by_name: dict[str, Company] = {}
+
+    def resolve(key: CompanyKey) -> Optional[Company]:
+        domain, name = key
+        return (by_domain.get(domain) if domain else None) or by_name.get(name)
+
+    domains = {domain for domain, _ in first_job if domain}
+    if domains:
+        by_domain.update(
+            (c.domain, c) for c in db.query(Company).filter(Company.domain.in_(domains))
+        )
+    names = {key[1] for key in first_job if resolve(key) is None}
+    if names:
+        for company in db.query(Company).filter(Company.name.in_(names)).order_by(Company.id):
+            by_name.setdefault(company.name, company)
+
+    # New companies with a domain — one INSERT, then one SELECT for their ids
+    new_by_domain: dict[str, dict] = {}
+    for key, job in first_job.items():
+        if key[0] and resolve(key) is None:
+            new_by_domain.setdefault(key[0], {
+                "name": job.company_name,
+                "domain": job.company_domain,
+                "website": job.company_url,
+                "location": job.location,
+            })
+    if new_by_domain:
+        db.execute(_insert_ignore_duplicates(db, Company, ["domain"]).values(list(new_by_domain.values())))
+        for company in db.query(Company).filter(Company.domain.in_(new_by_domain)):
+            by_domain[company.domain] = company
+            by_name.setdefault(company.name, company)
+
+    # New companies without a domain (nothing unique to conflict on)
+    new_by_name: dict[str, Company] = {}
+    for key, job in first_job.items():
+        if resolve(key) is None and key[1] not in new_by_name:
+            new_by_name[key[1]] = Company(
+                name=job.company_name,
+                website=job.company_url,
+                location=job.location,
+            )
+    if new_by_name:
+        db.add_all(new_by_name.values())
+        db.flush()
+        by_name.update(new_by_name)
+
+    logger.debug(
+        "Resolved %d companies (%d created)",
+        len(first_job), len(new_by_domain) + len(new_by_name),
+    )
+    return {key: resolve(key) for key in first_job}
+
+
 # ── Job Posting ───────────────────────────────────────────────────────────────
 
 def job_posting_exists(db: Session, url: str) -> bool:
@@ -76,10 +157,80 @@ def save_job_posting(db: Session, job: NormalizedJob, company: Company) -> JobPo
     return posting
 
 
+def existing_posting_urls(db: Session, urls: list[str]) -> set[str]:
+    """Return the subset of urls already stored — one query for a whole batch."""
+    if not urls:
+        return set()
+    rows = db.query(JobPosting.url).filter(JobPosting.url.in_(urls)).all()
+    return {url for (url,) in rows}
+
+
+def _insert_ignore_duplicates(db: Session, model, index_elements: list[str]):
+    """INSERT ... ON CONFLICT DO NOTHING for Postgres/SQLite, plain INSERT elsewhere."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model).on_conflict_do_nothing(index_elements=index_elements)
+    if dialect == "sqlite":
+        return sqlite.insert(model).on_conflict_do_nothing(index_elements=index_elements)
+    return insert(model)
+
+
+def save_job_postings_bulk(db: Session, jobs: list[tuple[NormalizedJob, Company]]) -> int:
+    """
+    Insert many (job, company) pairs in a single statement.
+
+    Rows whose URL already exists are silently skipped by the database, so a
+    concurrent ingestion run can't fail the batch. Returns the number inserted.
+    """
+    if not jobs:
+        return 0
+    rows = [
+        {
+            "company_id": company.id,
+            "title": job.title,
+            "description": job.description,
+            "url": job.job_url,
+            "source": job.source,
+            "posted_at": job.posted_at,
+            "is_processed": False,
+        }
+        for job, company in jobs
+    ]
+    result = db.execute(_insert_ignore_duplicates(db, JobPosting, ["url"]).values(rows))
+    inserted = result.rowcount if result.rowcount is not None and result.rowcount >= 0 else len(rows)
+    logger.debug("Bulk-saved %d of %d job postings", inserted, len(rows))
+    return inserted
+
+
+def store_new_postings(db: Session, jobs: list[NormalizedJob]) -> int:
+    """
+    Save the postings not stored yet — the ingestion pipeline's save step.
+
+    Jobs are deduped by URL against the DB (one query) and within the batch,
+    every remaining job's company is resolved in bulk, then all postings go
+    in with one insert. Returns the number of postings inserted; committing
+    is left to the caller.
+    """
+    existing = existing_posting_urls(db, [job.job_url for job in jobs if job.job_url])
+    new_jobs = []
+    for job in jobs:
+        if job.job_url:
+            if job.job_url in existing:
+                continue
+            existing.add(job.job_url)
+        new_jobs.append(job)
+
+    companies = get_or_create_companies(db, new_jobs)
+    return save_job_postings_bulk(
+        db, [(job, companies[(job.company_domain, job.company_name)]) for job in new_jobs],
+    )
+
+
 def get_unprocessed_postings(db: Session, limit: int = 50) -> list[JobPosting]:
-    """Return job postings that haven't been through AI qualification yet."""
+    """Return job postings that haven't been through AI qualification yet (company joined in)."""
     return (
         db.query(JobPosting)
+        .options(joinedload(JobPosting.company))
         .filter(JobPosting.is_processed == False)  # noqa: E712
         .order_by(JobPosting.created_at.asc())
         .limit(limit)
@@ -87,6 +238,14 @@ def get_unprocessed_postings(db: Session, limit: int = 50) -> list[JobPosting]:
     )
 
 
+def count_unprocessed_postings(db: Session, limit: Optional[int] = None) -> int:
+    """Count postings awaiting qualification (stopping at `limit` if given)."""
+    query = db.query(JobPosting.id).filter(JobPosting.is_processed == False)  # noqa: E712
+    if limit is not None:
+        query = query.limit(limit)
+    return db.query(func.count()).select_from(query.subquery()).scalar()
+
+
 def mark_posting_processed(db: Session, posting_id: int) -> None:
     """Mark a job posting as processed (AI ran on it)."""
     db.query(JobPosting).filter(JobPosting.id == posting_id).update(
@@ -94,6 +253,15 @@ def mark_posting_processed(db: Session, posting_id: int) -> None:
     )
 
 
+def mark_postings_processed(db: Session, posting_ids: list[int]) -> None:
+    """Mark many job postings as processed with one UPDATE ... WHERE id IN (...)."""
+    if not posting_ids:
+        return
+    db.query(JobPosting).filter(JobPosting.id.in_(posting_ids)).update(
+        {"is_processed": True}
+    )
+
+
 # ── Lead ─────────────────────────────────────────────────────────────────────
 
 def create_lead(
@@ -126,26 +294,62 @@ def create_lead(
     return lead
 
 
-def get_leads_by_status(db: Session, status: LeadStatus, limit: int = 50) -> list[Lead]:
-    """Fetch leads filtered by status."""
+def create_leads_bulk(db: Session, leads: list[dict]) -> int:
+    """
+    Insert many qualified leads in a single statement.
+
+    Each dict holds Lead column values (company_id, job_posting_id,
+    relevance_score, ai_analysis, reason, contact_role, company_pain_points);
+    status defaults to QUALIFIED. Returns the number of rows inserted.
+    """
+    if not leads:
+        return 0
+    db.execute(insert(Lead), [{"status": LeadStatus.QUALIFIED, **lead} for lead in leads])
+    logger.info("Created %d leads", len(leads))
+    return len(leads)
+
+
+def get_leads_by_status(
+    db: Session,
+    status: LeadStatus,
+    limit: int = 50,
+    min_score: Optional[float] = None,
+) -> list[Lead]:
+    """Fetch leads filtered by status (and optionally a minimum relevance_score), oldest first."""
+    query = db.query(Lead).options(*LEAD_RELATIONS).filter(Lead.status == status)
+    if min_score is not None:
+        # In SQL, so below-threshold rows are never fetched or loaded
+        query = query.filter(Lead.relevance_score >= min_score)
     return (
-        db.query(Lead)
-        .filter(Lead.status == status)
-        .order_by(Lead.created_at.asc())
+        query
+        .order_by(Lead.id.asc())  # insertion order, served by ix_leads_status_id
         .limit(limit)
         .all()
     )
 
 
+def leads_version(db: Session) -> tuple:
+    """Cheap fingerprint of the leads table: changes whenever a lead is added or updated."""
+    return db.query(func.count(Lead.id), func.max(Lead.id), func.max(Lead.updated_at)).one()
+
+
 def update_lead_status(db: Session, lead_id: int, status: LeadStatus) -> None:
     """Update the status of a lead."""
     db.query(Lead).filter(Lead.id == lead_id).update({"status": status})
     logger.debug("Lead %d status → %s", lead_id, status)
 
 
-def get_leads_for_outreach(db: Session, limit: int = 20) -> list[Lead]:
-    """Return qualified leads that haven't been emailed yet."""
-    return get_leads_by_status(db, LeadStatus.QUALIFIED, limit=limit)
+def update_leads_status(db: Session, lead_ids: list[int], status: LeadStatus) -> None:
+    """Update the status of many leads with one UPDATE ... WHERE id IN (...)."""
+    if not lead_ids:
+        return
+    db.query(Lead).filter(Lead.id.in_(lead_ids)).update({"status": status})
+    logger.debug("%d leads status → %s", len(lead_ids), status)
+
+
+def get_leads_for_outreach(db: Session, limit: int = 20, min_score: Optional[float] = None) -> list[Lead]:
+    """Return qualified leads that haven't been emailed yet, scoring at least min_score if given."""
+    return get_leads_by_status(db, LeadStatus.QUALIFIED, limit=limit, min_score=min_score)
 
 
 # ── Outreach Email ────────────────────────────────────────────────────────────
@@ -167,13 +371,27 @@ def log_outreach_email(
         body=body,
         delivery_status=delivery_status,
         error_message=error_message,
-        sent_at=datetime.utcnow() if delivery_status == DeliveryStatus.SENT else None,
+        sent_at=datetime.now(timezone.utc) if delivery_status == DeliveryStatus.SENT else None,
     )
     db.add(email)
     db.flush()
     return email
 
 
+def log_outreach_emails_bulk(db: Session, emails: list[dict]) -> int:
+    """
+    Insert many finished send attempts in a single statement.
+
+    Each dict holds OutreachEmail column values (lead_id, to_address,
+    subject, body, delivery_status, error_message, sent_at), as returned by
+    GmailMailer.adeliver(). Returns the number of rows inserted.
+    """
+    if not emails:
+        return 0
+    db.execute(insert(OutreachEmail), emails)
+    return len(emails)
+
+
 def update_email_delivery_status(
     db: Session,
     email_id: int,
@@ -183,7 +401,20 @@ def update_email_delivery_status(
     """Update delivery status after a send attempt."""
     update_data: dict = {"delivery_status": status}
     if status == DeliveryStatus.SENT:
-        update_data["sent_at"] = datetime.utcnow()
+        update_data["sent_at"] = func.now()  # database clock, same as created_at
     if error_message:
         update_data["error_message"] = error_message
     db.query(OutreachEmail).filter(OutreachEmail.id == email_id).update(update_data)
+
+
+def outreach_emails_version(db: Session) -> tuple:
+    """
+    Cheap fingerprint of outreach_emails: changes when a row is logged or
+    moves from PENDING to SENT (sent_at set) or FAILED (error_message set).
+    """
+    return db.query(
+        func.count(OutreachEmail.id),
+        func.max(OutreachEmail.id),
+        func.count(OutreachEmail.sent_at),
+        func.count(OutreachEmail.error_message),
+    ).one()
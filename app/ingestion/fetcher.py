@@ -5,12 +5,16 @@ Primary source: RemoteOK public API (free, no auth required).
   Docs: https://remoteok.com/api
 
 Returns a list of raw job dicts for downstream normalization.
+fetch_jobs_async() does the work on httpx.AsyncClient (one pooled connection
+reused across retries); fetch_jobs() is a blocking shim for the CLI scripts.
 """
 
+import asyncio
 import logging
 from typing import Any
 
-import requests
+import httpx
+import orjson
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from app.config import settings
@@ -24,42 +28,48 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; AILeadGenBot/1.0; +https://github.com/your-repo)"
 }
 
+# Network errors, bad statuses, and 200s whose body isn't JSON (e.g. an HTML
+# challenge page) — retried, then fetch_jobs_async() gives up with []
+FETCH_ERRORS = (httpx.HTTPError, orjson.JSONDecodeError)
+
 
 @retry(
-    retry=retry_if_exception_type(requests.RequestException),
+    retry=retry_if_exception_type(FETCH_ERRORS),
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=2, max=10),
     reraise=True,
 )
-def _fetch_remoteok_raw(tags: list[str] | None = None) -> list[dict[str, Any]]:
+async def _fetch_remoteok_raw(
+    client: httpx.AsyncClient, tags: list[str] | None = None,
+) -> list[dict[str, Any]]:
     """
     Internal: calls RemoteOK API with optional tag filter.
-    Retries up to 3 times on transient network errors.
+    Retries up to 3 times on transient network errors and non-JSON bodies,
+    on the caller's client so a retry reuses the kept-alive connection.
     """
     params = {}
     if tags:
         # RemoteOK accepts comma-separated tags via the 'tags' query param
         params["tags"] = ",".join(tags)
 
-    response = requests.get(
-        REMOTEOK_API_URL,
-        headers=HEADERS,
-        params=params,
-        timeout=15,
-    )
+    response = await client.get(REMOTEOK_API_URL, params=params)
     response.raise_for_status()
+    # The full feed is several MB; orjson decodes the raw bytes in C
+    return _extract_jobs(orjson.loads(response.content))
 
-    data = response.json()
 
-    # RemoteOK always returns a legal notice dict as the first element — skip it
-    jobs = [item for item in data if isinstance(item, dict) and "id" in item]
-    return jobs
+def _extract_jobs(data: Any) -> list[dict[str, Any]]:
+    """RemoteOK always returns a legal notice dict as the first element — skip it."""
+    return [item for item in data if isinstance(item, dict) and "id" in item]
 
 
 def fetch_jobs(tags: list[str] | None = None, limit: int | None = None) -> list[dict[str, Any]]:
     """
     Fetch job postings from RemoteOK.
 
+    Blocking wrapper around fetch_jobs_async() for scripts and other
+    non-async callers.
+
     Args:
         tags:  Optional list of role/tech tags to filter by (e.g. ["engineer", "cto"]).
                If None, fetches all remote jobs.
@@ -68,14 +78,26 @@ def fetch_jobs(tags: list[str] | None = None, limit: int | None = None) -> list[
     Returns:
         List of raw job dicts from the API.
     """
+    return asyncio.run(fetch_jobs_async(tags=tags, limit=limit))
+
+
+async def fetch_jobs_async(
+    tags: list[str] | None = None,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Async version of fetch_jobs() — same arguments and result, but awaits the
+    HTTP request instead of blocking the calling thread.
+    """
     if limit is None:
         limit = settings.max_jobs_per_run
 
     logger.info("Fetching jobs from RemoteOK (tags=%s, limit=%d)...", tags, limit)
 
     try:
-        jobs = _fetch_remoteok_raw(tags=tags)
-    except requests.RequestException as e:
+        async with httpx.AsyncClient(headers=HEADERS, timeout=15) as client:
+            jobs = await _fetch_remoteok_raw(client, tags=tags)
+    except FETCH_ERRORS as e:
         logger.error("Failed to fetch jobs from RemoteOK after retries: %s", e)
         return []
 
@@ -5,12 +5,19 @@ Stage 1 (fast): keyword pre-filter — checks job title/tags against a keyword l
 Stage 2 (deep): uses the AI engine to generate domain-specific keywords
                 matching the user's product description.
 
-The keyword list is generated once per run by the LLM and cached in memory.
+The keyword list is generated by the LLM once per product description and
+cached in memory and in the on-disk LLM cache (so it survives restarts).
 """
 
 import logging
+from collections.abc import Callable
 from functools import lru_cache
 
+try:
+    import ahocorasick
+except ImportError:  # C extension; fall back to substring checks without it
+    ahocorasick = None
+
 from app.ingestion.normalizer import NormalizedJob
 from app.config import settings
 
@@ -42,6 +49,25 @@ def _job_text(job: NormalizedJob) -> str:
     return " ".join(p for p in parts if p).lower()
 
 
+@lru_cache(maxsize=8)
+def _keyword_matcher(keywords: tuple[str, ...]) -> Callable[[str], bool]:
+    """
+    Return a predicate "does text contain any keyword?", built once per keyword set.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed: one pass
+    over a job's text finds any keyword, so matching cost no longer grows
+    with the number of keywords. Otherwise checks each keyword in turn.
+    """
+    if ahocorasick is None:
+        return lambda text: any(kw in text for kw in keywords)
+
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+
 def keyword_filter(
     jobs: list[NormalizedJob],
     keywords: list[str] | None = None,
@@ -61,12 +87,13 @@ def keyword_filter(
         Filtered list of NormalizedJob.
     """
     kw_list = [k.lower() for k in (keywords or DEFAULT_BUYER_ROLES)]
-    passed = []
 
-    for job in jobs:
-        text = _job_text(job)
-        if any(kw in text for kw in kw_list):
-            passed.append(job)
+    if "" in kw_list:
+        # An empty keyword matches every string (same as `"" in text`)
+        passed = list(jobs)
+    else:
+        matches = _keyword_matcher(tuple(sorted(set(kw_list))))
+        passed = [job for job in jobs if matches(_job_text(job))]
 
     logger.info(
         "Keyword filter: %d / %d jobs passed (keywords=%s).",
@@ -81,7 +108,8 @@ def keyword_filter(
 def get_ai_keywords() -> list[str]:
     """
     Call the AI engine to generate role keywords relevant to the configured
-    product description. Result is cached for the lifetime of the process.
+    product description. Result is cached for the lifetime of the process
+    (and on disk by the AI engine, so later runs skip the LLM call).
 
     Returns DEFAULT_BUYER_ROLES on failure.
     """
@@ -1,25 +1,41 @@
 """
 app/ingestion/normalizer.py — Cleans and standardizes raw job posting dicts.
 
-Takes raw API responses from fetcher.py and returns clean, typed Pydantic models
-ready for storage and AI processing.
+Takes raw API responses from fetcher.py and returns clean, typed NormalizedJob
+records ready for storage and AI processing.
 """
 
 import logging
 import re
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlparse
 
-from bs4 import BeautifulSoup
-from pydantic import BaseModel, Field
+try:
+    # C (lexbor) HTML parser — much faster than building a BeautifulSoup tree
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+    from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+# Descriptions are stored at the length the qualification prompt uses —
+# anything past this was never sent to the LLM anyway
+MAX_DESCRIPTION_CHARS = 2000
+
+# Compiled once — _strip_html() runs on every fetched job
+_WS_RE = re.compile(r"\s+")
+
 
 # ── Output schema ────────────────────────────────────────────────────────────
 
-class NormalizedJob(BaseModel):
+# A plain slotted dataclass rather than a Pydantic model: instances only ever
+# come from normalize_job(), so per-instance validation would be pure overhead
+@dataclass(slots=True, kw_only=True)
+class NormalizedJob:
     """Clean, structured job posting ready for filtering and DB storage."""
 
     source: str = "remoteok"
@@ -31,7 +47,7 @@ class NormalizedJob(BaseModel):
     job_url: str | None = None
     location: str | None = None
     description: str                        # plain text, stripped of HTML
-    tags: list[str] = Field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
     posted_at: datetime | None = None
 
 
@@ -41,10 +57,14 @@ def _strip_html(raw: str) -> str:
     """Remove all HTML tags and decode HTML entities."""
     if not raw:
         return ""
-    soup = BeautifulSoup(raw, "lxml")
-    text = soup.get_text(separator=" ")
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(raw)
+        tree.strip_tags(["script", "style"])   # BeautifulSoup+lxml drops these too
+        text = tree.text(separator=" ")
+    else:
+        text = BeautifulSoup(raw, "lxml").get_text(separator=" ")
     # Collapse extra whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WS_RE.sub(" ", text).strip()
     return text
 
 
@@ -53,8 +73,13 @@ def _extract_domain(url: str | None) -> str | None:
     if not url:
         return None
     try:
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
+        scheme, sep, rest = url.partition("://")
+        if sep and scheme:
+            # Fast path for the absolute http(s) URLs RemoteOK returns — same
+            # netloc as urlparse() without its general-purpose parsing
+            domain = rest.partition("/")[0].partition("?")[0].partition("#")[0].lower()
+        else:
+            domain = urlparse(url).netloc.lower()
         # Strip 'www.'
         if domain.startswith("www."):
             domain = domain[4:]
@@ -69,15 +94,17 @@ def _parse_date(value: Any) -> datetime | None:
         return None
     try:
         if isinstance(value, (int, float)):
-            return datetime.utcfromtimestamp(value)
+            return datetime.fromtimestamp(value, tz=timezone.utc)
         return datetime.fromisoformat(str(value))
     except Exception:
         return None
 
 
+@lru_cache(maxsize=1024)
 def _normalize_title(title: str) -> str:
-    """Capitalize words and strip excess whitespace."""
-    return " ".join(word.capitalize() for word in title.strip().split()) if title else ""
+    """Capitalize words and strip excess whitespace (titles recur across feeds)."""
+    # Not str.title(): that would turn "3rd" into "3Rd" and keep double spaces
+    return " ".join(map(str.capitalize, title.split())) if title else ""
 
 
 # ── Main function ────────────────────────────────────────────────────────────
@@ -108,6 +135,8 @@ def normalize_job(raw: dict[str, Any]) -> NormalizedJob | None:
             # Fallback: use tags as a minimal description context
             tags = raw.get("tags") or []
             description = f"Role: {title} at {company_name}. Tags: {', '.join(tags)}"
+        if len(description) > MAX_DESCRIPTION_CHARS:
+            description = description[:MAX_DESCRIPTION_CHARS] + "..."
 
         return NormalizedJob(
             source="remoteok",
@@ -118,7 +147,7 @@ def normalize_job(raw: dict[str, Any]) -> NormalizedJob | None:
             company_url=company_url,
             job_url=job_url,
             location=raw.get("location") or "Remote",
-            description=description[:4000],  # cap to avoid LLM context issues
+            description=description,
             tags=[t.lower() for t in (raw.get("tags") or [])],
             posted_at=_parse_date(raw.get("date") or raw.get("epoch")),
         )
@@ -130,11 +159,7 @@ def normalize_job(raw: dict[str, Any]) -> NormalizedJob | None:
 
 def normalize_jobs(raw_jobs: list[dict[str, Any]]) -> list[NormalizedJob]:
     """Normalize a batch of raw job dicts. Skips invalid entries."""
-    results = []
-    for raw in raw_jobs:
-        job = normalize_job(raw)
-        if job:
-            results.append(job)
+    results = [job for job in map(normalize_job, raw_jobs) if job]
 
     logger.info("Normalized %d / %d jobs successfully.", len(results), len(raw_jobs))
     return results
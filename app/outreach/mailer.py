@@ -2,17 +2,26 @@
 app/outreach/mailer.py — Gmail SMTP mailer with dry-run support.
 
 GmailMailer sends (or simulates sending) outreach emails and logs
-every attempt to the database via the repository layer.
+every attempt to the database via the repository layer. adeliver() only
+sends, returning the attempt as a row for callers to persist in bulk.
 """
 
+import asyncio
 import logging
 import smtplib
+import threading
 from email.mime.multipart import MIMEMultipart
+from datetime import datetime, timezone
 from email.mime.text import MIMEText
 from typing import Optional
 
 from sqlalchemy.orm import Session
 
+try:
+    import aiosmtplib
+except ImportError:  # adeliver() falls back to smtplib in a worker thread
+    aiosmtplib = None
+
 from app.config import settings
 from app.db import repository
 from app.db.models import DeliveryStatus
@@ -23,6 +32,11 @@ logger = logging.getLogger(__name__)
 # Gmail SMTP constants
 GMAIL_SMTP_HOST = "smtp.gmail.com"
 GMAIL_SMTP_PORT = 465  # SSL
+# Reconnect after this many messages on one SMTP session
+MAX_MESSAGES_PER_CONNECTION = 100
+# SMTP sessions adeliver() may run in parallel inside `async with` (each session
+# carries one message at a time; Gmail throttles many more than this)
+MAX_ASYNC_CONNECTIONS = 4
 
 
 class GmailMailer:
@@ -31,12 +45,54 @@ class GmailMailer:
 
     In dry-run mode (MAILER_DRY_RUN=true) emails are printed to stdout
     and never actually transmitted — safe for development and demos.
+
+    Used as a context manager (``with`` / ``async with``), one logged-in SMTP
+    connection is shared by every send inside the block instead of opening a
+    new TLS session + AUTH per email:
+
+        with GmailMailer() as mailer:
+            for lead in leads:
+                mailer.send(db, lead.id, to_address, email)
+
+    Inside ``async with``, adeliver()/asend() talk SMTP natively via aiosmtplib
+    and keep up to MAX_ASYNC_CONNECTIONS logged-in sessions, so concurrent
+    sends overlap instead of queueing behind one connection.
     """
 
     def __init__(self, dry_run: Optional[bool] = None):
         self.smtp_user = settings.gmail_user
         self.smtp_password = settings.gmail_app_password
         self.dry_run = dry_run if dry_run is not None else settings.mailer_dry_run
+        self._reuse_connection = False
+        self._server: Optional[smtplib.SMTP_SSL] = None
+        self._sent_on_connection = 0
+        self._smtp_lock = threading.Lock()  # one SMTP conversation at a time
+        # Idle aiosmtplib sessions as [client, messages sent on it]
+        self._async_idle: list[list] = []
+        self._async_slots = asyncio.Semaphore(MAX_ASYNC_CONNECTIONS)
+
+    # ── Connection lifecycle ──────────────────────────────────────────────────
+
+    def __enter__(self) -> "GmailMailer":
+        # The connection itself is opened lazily on the first real send
+        self._reuse_connection = True
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "GmailMailer":
+        return self.__enter__()
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._aclose_connections()
+        await asyncio.to_thread(self.close)
+
+    def close(self) -> None:
+        """Log out of the shared SMTP connection, if one is open."""
+        with self._smtp_lock:
+            self._reuse_connection = False
+            self._disconnect()
 
     # ── Public API ────────────────────────────────────────────────────────────
 
@@ -50,6 +106,9 @@ class GmailMailer:
         """
         Send (or simulate) a single outreach email and log it to the DB.
 
+        The log rows are written into db's open transaction; committing is
+        left to the caller, so a batch doesn't pay for two commits per email.
+
         Args:
             db:         Active SQLAlchemy session.
             lead_id:    ID of the Lead this email belongs to.
@@ -59,8 +118,79 @@ class GmailMailer:
         Returns:
             True on success (real send or dry-run), False on send failure.
         """
-        # Log the attempt before sending (pending status)
-        email_record = repository.log_outreach_email(
+        email_record = self._log_pending(db, lead_id, to_address, email)
+
+        if self.dry_run:
+            return self._complete_dry_run(db, email_record.id, to_address, email)
+
+        try:
+            self._send_via_smtp(to_address, email)
+        except Exception as exc:
+            return self._record_failure(db, email_record.id, to_address, exc)
+        return self._record_success(db, email_record.id, to_address, lead_id)
+
+    async def asend(
+        self,
+        db: Session,
+        lead_id: int,
+        to_address: str,
+        email: RenderedEmail,
+    ) -> bool:
+        """
+        Async version of send() for one email inside the FastAPI event loop.
+
+        The SMTP exchange is awaited and the attempt is logged from a worker
+        thread, so the loop never blocks on Gmail or the database. Sessions
+        aren't thread-safe: to send many emails concurrently, gather
+        adeliver() instead and persist the rows in one step.
+        """
+        delivery = await self.adeliver(lead_id, to_address, email)
+        await asyncio.to_thread(repository.log_outreach_emails_bulk, db, [delivery])
+        return delivery["delivery_status"] == DeliveryStatus.SENT
+
+    async def adeliver(self, lead_id: int, to_address: str, email: RenderedEmail) -> dict:
+        """
+        Send (or simulate) one email without touching the database.
+
+        The SMTP exchange is awaited (aiosmtplib, or smtplib in a worker
+        thread without it). Returns the attempt as OutreachEmail column values
+        (delivery_status SENT or FAILED) for repository.log_outreach_emails_bulk().
+        """
+        delivery = {
+            "lead_id": lead_id,
+            "to_address": to_address,
+            "subject": email.subject,
+            "body": email.plain_body,
+            "delivery_status": DeliveryStatus.SENT,
+            "error_message": None,
+            "sent_at": None,
+        }
+
+        if self.dry_run:
+            self._print_dry_run(to_address, email)
+            logger.info("DRY RUN: email to %s printed (not sent).", to_address)
+        else:
+            try:
+                if aiosmtplib is None:
+                    await asyncio.to_thread(self._send_via_smtp, to_address, email)
+                else:
+                    await self._asend_via_smtp(to_address, email)
+            except Exception as exc:
+                logger.error("Failed to send email to %s: %s", to_address, exc)
+                delivery["delivery_status"] = DeliveryStatus.FAILED
+                delivery["error_message"] = str(exc)
+                return delivery
+            logger.info("Email sent to %s (lead_id=%d).", to_address, lead_id)
+
+        delivery["sent_at"] = datetime.now(timezone.utc)
+        return delivery
+
+    # ── Private helpers ───────────────────────────────────────────────────────
+
+    @staticmethod
+    def _log_pending(db: Session, lead_id: int, to_address: str, email: RenderedEmail):
+        """Log the attempt before sending (pending status)."""
+        return repository.log_outreach_email(
             db=db,
             lead_id=lead_id,
             subject=email.subject,
@@ -69,36 +199,30 @@ class GmailMailer:
             delivery_status=DeliveryStatus.PENDING,
         )
 
-        if self.dry_run:
-            self._print_dry_run(to_address, email)
-            repository.update_email_delivery_status(
-                db, email_record.id, DeliveryStatus.SENT
-            )
-            db.commit()
-            logger.info("DRY RUN: email to %s logged (not sent).", to_address)
-            return True
+    def _complete_dry_run(
+        self, db: Session, email_id: int, to_address: str, email: RenderedEmail,
+    ) -> bool:
+        self._print_dry_run(to_address, email)
+        repository.update_email_delivery_status(db, email_id, DeliveryStatus.SENT)
+        logger.info("DRY RUN: email to %s logged (not sent).", to_address)
+        return True
 
-        try:
-            self._send_via_smtp(to_address, email)
-            repository.update_email_delivery_status(
-                db, email_record.id, DeliveryStatus.SENT
-            )
-            db.commit()
-            logger.info("Email sent to %s (lead_id=%d).", to_address, lead_id)
-            return True
-        except Exception as exc:
-            error_msg = str(exc)
-            repository.update_email_delivery_status(
-                db, email_record.id, DeliveryStatus.FAILED, error_message=error_msg
-            )
-            db.commit()
-            logger.error("Failed to send email to %s: %s", to_address, error_msg)
-            return False
+    @staticmethod
+    def _record_success(db: Session, email_id: int, to_address: str, lead_id: int) -> bool:
+        repository.update_email_delivery_status(db, email_id, DeliveryStatus.SENT)
+        logger.info("Email sent to %s (lead_id=%d).", to_address, lead_id)
+        return True
 
-    # ── Private helpers ───────────────────────────────────────────────────────
+    @staticmethod
+    def _record_failure(db: Session, email_id: int, to_address: str, exc: Exception) -> bool:
+        error_msg = str(exc)
+        repository.update_email_delivery_status(
+            db, email_id, DeliveryStatus.FAILED, error_message=error_msg
+        )
+        logger.error("Failed to send email to %s: %s", to_address, error_msg)
+        return False
 
-    def _send_via_smtp(self, to_address: str, email: RenderedEmail) -> None:
-        """Establish an SSL connection to Gmail and transmit the message."""
+    def _build_message(self, to_address: str, email: RenderedEmail) -> MIMEMultipart:
         msg = MIMEMultipart("alternative")
         msg["Subject"] = email.subject
         msg["From"] = self.smtp_user
@@ -107,20 +231,113 @@ class GmailMailer:
         # Attach plain text first, HTML second — clients prefer the last part
         msg.attach(MIMEText(email.plain_body, "plain", "utf-8"))
         msg.attach(MIMEText(email.html_body, "html", "utf-8"))
+        return msg
+
+    def _send_via_smtp(self, to_address: str, email: RenderedEmail) -> None:
+        """Transmit the message over the shared connection, or a one-off one."""
+        # Serialize once, before taking the lock — a retry resends the same bytes
+        raw = self._build_message(to_address, email).as_string()
+
+        if not self._reuse_connection:
+            with smtplib.SMTP_SSL(GMAIL_SMTP_HOST, GMAIL_SMTP_PORT) as server:
+                server.login(self.smtp_user, self.smtp_password)
+                server.sendmail(self.smtp_user, to_address, raw)
+            return
 
-        with smtplib.SMTP_SSL(GMAIL_SMTP_HOST, GMAIL_SMTP_PORT) as server:
+        with self._smtp_lock:
+            try:
+                self._connection().sendmail(self.smtp_user, to_address, raw)
+            except smtplib.SMTPServerDisconnected:
+                # Gmail drops idle sessions — reconnect once and retry
+                logger.warning("SMTP connection dropped; reconnecting.")
+                self._server = None
+                self._connection().sendmail(self.smtp_user, to_address, raw)
+            self._sent_on_connection += 1
+
+    def _connection(self) -> smtplib.SMTP_SSL:
+        """Return the shared logged-in connection, opening a fresh one if needed."""
+        if self._server is not None and self._sent_on_connection >= MAX_MESSAGES_PER_CONNECTION:
+            self._disconnect()
+        if self._server is None:
+            server = smtplib.SMTP_SSL(GMAIL_SMTP_HOST, GMAIL_SMTP_PORT)
             server.login(self.smtp_user, self.smtp_password)
-            server.sendmail(self.smtp_user, to_address, msg.as_string())
+            self._server = server
+            self._sent_on_connection = 0
+        return self._server
+
+    def _disconnect(self) -> None:
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass  # already gone — nothing to clean up
+        self._server = None
+
+    async def _asend_via_smtp(self, to_address: str, email: RenderedEmail) -> None:
+        """aiosmtplib version of _send_via_smtp(), drawing on a small connection pool."""
+        msg = self._build_message(to_address, email)
+
+        if not self._reuse_connection:
+            await aiosmtplib.send(
+                msg,
+                hostname=GMAIL_SMTP_HOST,
+                port=GMAIL_SMTP_PORT,
+                use_tls=True,
+                username=self.smtp_user,
+                password=self.smtp_password,
+            )
+            return
+
+        async with self._async_slots:
+            entry = self._async_idle.pop() if self._async_idle else None
+            if entry is not None and entry[1] >= MAX_MESSAGES_PER_CONNECTION:
+                await self._aquit(entry[0])
+                entry = None
+            if entry is None:
+                entry = [await self._aconnect(), 0]
+            try:
+                await entry[0].send_message(msg)
+            except aiosmtplib.SMTPServerDisconnected:
+                # Gmail drops idle sessions — reconnect once and retry
+                logger.warning("SMTP connection dropped; reconnecting.")
+                entry = [await self._aconnect(), 0]
+                await entry[0].send_message(msg)
+            finally:
+                if entry[0].is_connected:
+                    self._async_idle.append(entry)
+            entry[1] += 1
+
+    async def _aconnect(self) -> "aiosmtplib.SMTP":
+        client = aiosmtplib.SMTP(hostname=GMAIL_SMTP_HOST, port=GMAIL_SMTP_PORT, use_tls=True)
+        await client.connect()
+        await client.login(self.smtp_user, self.smtp_password)
+        return client
+
+    @staticmethod
+    async def _aquit(client: "aiosmtplib.SMTP") -> None:
+        try:
+            await client.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            pass  # already gone — nothing to clean up
+
+    async def _aclose_connections(self) -> None:
+        """Log out of every pooled aiosmtplib session."""
+        idle, self._async_idle = self._async_idle, []
+        await asyncio.gather(*(self._aquit(client) for client, _ in idle))
 
     @staticmethod
     def _print_dry_run(to_address: str, email: RenderedEmail) -> None:
         """Pretty-print the email to stdout for dry-run inspection."""
         separator = "─" * 60
-        print(f"\n{separator}")
-        print(f"  📧  DRY RUN — Email not sent")
-        print(separator)
-        print(f"  To      : {to_address}")
-        print(f"  Subject : {email.subject}")
-        print(separator)
-        print(email.plain_body)
-        print(f"{separator}\n")
+        # One write per email, so concurrent sends can't interleave their lines
+        print("\n".join((
+            f"\n{separator}",
+            "  📧  DRY RUN — Email not sent",
+            separator,
+            f"  To      : {to_address}",
+            f"  Subject : {email.subject}",
+            separator,
+            email.plain_body,
+            f"{separator}\n",
+        )))
@@ -7,9 +7,10 @@ text fallback since many clients prefer it.
 """
 
 from dataclasses import dataclass
+from html import escape
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderedEmail:
     """Final email ready to be sent — subject, HTML body, plain-text body."""
     subject: str
@@ -29,19 +30,22 @@ def render_email(subject: str, plain_body: str, sender_name: str = "Vithusan") -
     Returns:
         RenderedEmail with subject, HTML body, and plain-text body.
     """
-    # Convert plain text newlines to HTML paragraphs
-    paragraphs = [
-        f"<p>{line}</p>" if line.strip() else "<br>"
+    # Convert plain text newlines to HTML paragraphs, escaping the drafted text
+    # in the same pass so a stray "<" or "&" can't break (or inject) markup.
+    # A list, not a generator: str.join materializes its input anyway.
+    html_content = "\n".join([
+        f"<p>{escape(line, quote=False)}</p>" if line.strip() else "<br>"
         for line in plain_body.strip().splitlines()
-    ]
-    html_content = "\n".join(paragraphs)
+    ])
+    subject_html = escape(subject, quote=False)
+    sender_html = escape(sender_name, quote=False)
 
     html_body = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{subject}</title>
+  <title>{subject_html}</title>
   <style>
     body {{
       font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
@@ -73,7 +77,7 @@ def render_email(subject: str, plain_body: str, sender_name: str = "Vithusan") -
   <div class="container">
     {html_content}
     <div class="signature">
-      <strong>{sender_name}</strong>
+      <strong>{sender_html}</strong>
     </div>
   </div>
 </body>
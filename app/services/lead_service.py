@@ -4,45 +4,92 @@ ingestion → AI qualification → DB persistence pipeline.
 
 This is the "glue" layer that coordinates:
   - Fetching unprocessed job postings from the DB
-  - Running AI qualification on each
+  - Running AI qualification in batches (concurrently, bounded)
   - Saving qualified leads
   - Marking postings as processed
 """
 
-import json
+import asyncio
 import logging
 
+import orjson
+from sqlalchemy.orm import Session
+
 from app.config import settings
 from app.db.models import JobPosting
 from app.db.repository import (
-    create_lead,
+    create_leads_bulk,
     get_leads_for_outreach,
     get_unprocessed_postings,
-    mark_posting_processed,
+    mark_postings_processed,
     update_lead_status,
 )
 from app.db.models import LeadStatus
 from app.db.session import get_session
-from app.ai_engine.processor import qualify_lead
+from app.ai_engine.processor import QualificationResult, aqualify_leads_batch
+from app.ai_engine.utils import gather_bounded
 from app.services.scoring import is_lead_qualified
 
 logger = logging.getLogger(__name__)
 
+# Time budget per posting in a qualification request (a batch of N postings
+# gets N times as long)
+QUALIFICATION_TIMEOUT_SECONDS = 60
+
+# company_pain_points for the common no-pain-points answer, without serializing
+_NO_PAIN_POINTS = "[]"
+
+
+def _qualification_kwargs(posting: JobPosting) -> dict:
+    """The per-posting fields the qualification prompt sees — also its dedup key."""
+    return {
+        "company_name": posting.company.name,
+        "job_title": posting.title,
+        "job_description": posting.description or "",
+        "location": posting.company.location or "Remote",
+    }
+
+
+async def _qualify_batch(batch: list[dict]) -> list[QualificationResult]:
+    """Qualify a batch of postings in one LLM request, within its time budget."""
+    return await asyncio.wait_for(
+        aqualify_leads_batch(batch, settings.product_description),
+        timeout=QUALIFICATION_TIMEOUT_SECONDS * len(batch),
+    )
+
 
 def process_new_postings(limit: int = 20) -> dict:
     """
     Fetch unprocessed job postings, run AI qualification, and persist qualified leads.
 
+    Blocking wrapper around aprocess_new_postings() for scripts and other
+    non-async callers.
+
     Args:
         limit: Max postings to process in one call.
 
     Returns:
         A summary dict: {"processed": int, "qualified": int, "rejected": int}
     """
+    return asyncio.run(aprocess_new_postings(limit=limit))
+
+
+async def aprocess_new_postings(limit: int = 20, concurrency: int | None = None) -> dict:
+    """
+    Async version of process_new_postings().
+
+    Pending postings are grouped into batches of settings.qualification_batch_size
+    and every batch is sent to the LLM at once (at most `concurrency` requests
+    in flight, default settings.llm_concurrency); results are written to the
+    DB after every call has finished.
+    """
     stats = {"processed": 0, "qualified": 0, "rejected": 0}
 
     with get_session() as db:
-        postings: list[JobPosting] = get_unprocessed_postings(db, limit=limit)
+        # Blocking DB work runs in a worker thread so the event loop stays free
+        postings: list[JobPosting] = await asyncio.to_thread(
+            get_unprocessed_postings, db, limit,
+        )
 
         if not postings:
             logger.info("No unprocessed job postings found.")
@@ -50,59 +97,103 @@ def process_new_postings(limit: int = 20) -> dict:
 
         logger.info("Processing %d job postings through AI qualification...", len(postings))
 
-        for posting in postings:
-            try:
-                result = qualify_lead(
-                    company_name=posting.company.name,
-                    job_title=posting.title,
-                    job_description=posting.description or "",
-                    location=posting.company.location or "Remote",
-                    product_description=settings.product_description,
-                )
+        # Reposts with identical inputs share one LLM call; the result is
+        # fanned back out to every posting with that key
+        inputs = [_qualification_kwargs(posting) for posting in postings]
+        keys = [tuple(kwargs.values()) for kwargs in inputs]
+        unique = dict(zip(keys, inputs))
+        if len(unique) < len(postings):
+            logger.info("Deduplicated %d repeat postings in batch.", len(postings) - len(unique))
+
+        size = settings.qualification_batch_size
+        unique_keys = list(unique)
+        batches = [unique_keys[i:i + size] for i in range(0, len(unique_keys), size)]
+
+        outcomes = await gather_bounded(
+            (_qualify_batch([unique[key] for key in batch]) for batch in batches),
+            concurrency or settings.llm_concurrency,
+            return_exceptions=True,
+        )
+        # A failed batch fails every posting in it (they stay unprocessed for retry)
+        by_key = {}
+        for batch, outcome in zip(batches, outcomes):
+            if isinstance(outcome, BaseException):
+                by_key.update(dict.fromkeys(batch, outcome))
+            else:
+                by_key.update(zip(batch, outcome))
+        results = [by_key[key] for key in keys]
+
+        await asyncio.to_thread(_record_results, db, postings, results, stats)
+
+    logger.info("Qualification done: %s", stats)
+    return stats
+
+
+def _record_results(
+    db: Session,
+    postings: list[JobPosting],
+    results: list[QualificationResult | BaseException],
+    stats: dict,
+) -> None:
+    """
+    Persist qualification outcomes and update stats in place (blocking).
 
-                # Mark posting as processed regardless of qualification outcome
-                mark_posting_processed(db, posting.id)
-                stats["processed"] += 1
-
-                if is_lead_qualified(result):
-                    create_lead(
-                        db=db,
-                        company=posting.company,
-                        posting=posting,
-                        relevance_score=result.relevance_score,
-                        ai_analysis=result.raw_response,
-                        reason=result.reason,
-                        contact_role=result.target_contact_role,
-                        company_pain_points=json.dumps(result.company_pain_points),
-                    )
-                    stats["qualified"] += 1
-                    logger.info(
-                        "✅ Qualified: %s @ %s (score=%.1f)",
-                        posting.title, posting.company.name, result.relevance_score,
-                    )
-                else:
-                    stats["rejected"] += 1
-                    logger.info(
-                        "❌ Rejected: %s @ %s (score=%.1f)",
-                        posting.title, posting.company.name, result.relevance_score,
-                    )
-
-            except Exception as e:
-                logger.error(
-                    "Error processing posting %d (%s): %s",
-                    posting.id, posting.title, e,
+    Outcomes are collected first, then written with one UPDATE for the
+    processed postings and one INSERT for the new leads.
+    """
+    processed_ids: list[int] = []
+    lead_rows: list[dict] = []
+
+    for posting, result in zip(postings, results):
+        try:
+            if isinstance(result, BaseException):
+                raise result
+
+            # Mark posting as processed regardless of qualification outcome
+            processed_ids.append(posting.id)
+            stats["processed"] += 1
+
+            if is_lead_qualified(result):
+                lead_rows.append({
+                    "company_id": posting.company_id,
+                    "job_posting_id": posting.id,
+                    "relevance_score": result.relevance_score,
+                    "ai_analysis": result.raw_response,
+                    "reason": result.reason,
+                    "contact_role": result.target_contact_role,
+                    "company_pain_points": (
+                        orjson.dumps(result.company_pain_points).decode()
+                        if result.company_pain_points else _NO_PAIN_POINTS
+                    ),
+                })
+                stats["qualified"] += 1
+                logger.info(
+                    "✅ Qualified: %s @ %s (score=%.1f)",
+                    posting.title, posting.company.name, result.relevance_score,
                 )
-                # Don't mark as processed so it can be retried
+            else:
                 stats["rejected"] += 1
+                logger.info(
+                    "❌ Rejected: %s @ %s (score=%.1f)",
+                    posting.title, posting.company.name, result.relevance_score,
+                )
 
-    logger.info("Qualification done: %s", stats)
-    return stats
+        except Exception as e:
+            logger.error(
+                "Error processing posting %d (%s): %s",
+                posting.id, posting.title, e,
+            )
+            # Don't mark as processed so it can be retried
+            stats["rejected"] += 1
+
+    mark_postings_processed(db, processed_ids)
+    create_leads_bulk(db, lead_rows)
 
 
 def get_qualified_leads_for_outreach(limit: int = 20) -> list:
     """Return qualified leads that haven't been emailed yet."""
     with get_session() as db:
-        return get_leads_for_outreach(db, limit=limit)
+        return get_leads_for_outreach(db, limit=limit, min_score=settings.min_relevance_score)
 
 
 def mark_lead_as_emailed(lead_id: int) -> None:
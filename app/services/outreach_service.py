@@ -0,0 +1,109 @@
+"""
+app/services/outreach_service.py — Glue between stored leads, the
+email-draft chain and the mailer, shared by the /outreach routes and
+scripts/run_outreach.py.
+"""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy.orm import Session
+
+from app.ai_engine.utils import gather_bounded
+from app.config import settings
+from app.db.models import DeliveryStatus, Lead, LeadStatus
+from app.db.repository import log_outreach_emails_bulk, update_leads_status
+
+# Finished deliveries per outreach checkpoint: their email log rows and lead
+# statuses are committed together while later leads are still in flight
+OUTREACH_COMMIT_EVERY = 25
+
+# Tells the checkpoint consumer that every delivery has finished
+_DONE = object()
+
+
+def _pain_points(lead: Lead) -> list[str]:
+    """Decode the JSON-encoded pain points stored on a lead."""
+    try:
+        points = json.loads(lead.company_pain_points or "[]")
+    except ValueError:
+        return []
+    return points if isinstance(points, list) else []
+
+
+def draft_kwargs_for_lead(lead: Lead) -> dict:
+    """Arguments for adraft_email() / astream_email_draft(), built from a lead and its relations."""
+    company = lead.company
+    posting = lead.job_posting
+    return {
+        "company_name": company.name if company else "Unknown",
+        "job_title": posting.title if posting else "Unknown",
+        "contact_role": lead.contact_role or "Engineering Leader",
+        "reason": lead.reason or "",
+        "pain_points": _pain_points(lead),
+        "product_description": settings.product_description,
+    }
+
+
+def record_deliveries(db: Session, deliveries: list[dict]) -> None:
+    """
+    Persist GmailMailer.adeliver() results and commit them (blocking).
+
+    One INSERT logs every attempt and one UPDATE moves the leads that were
+    sent to EMAILED, so the log rows and lead statuses commit together. Call
+    it from a worker thread, never concurrently on the same session.
+    """
+    log_outreach_emails_bulk(db, deliveries)
+    update_leads_status(
+        db,
+        [d["lead_id"] for d in deliveries if d["delivery_status"] == DeliveryStatus.SENT],
+        LeadStatus.EMAILED,
+    )
+    db.commit()
+
+
+async def adeliver_with_checkpoints(
+    db: Session,
+    leads: list[Lead],
+    deliver: Callable[[Lead], Awaitable[dict | None]],
+    concurrency: int,
+) -> list[dict | None | BaseException]:
+    """
+    Run deliver(lead) for every lead, checkpointing every OUTREACH_COMMIT_EVERY rows.
+
+    One bounded pipeline covers the whole batch: up to `concurrency` leads
+    are in flight and the next starts as soon as any finishes. Finished rows
+    go to a single consumer that hands each OUTREACH_COMMIT_EVERY of them to
+    record_deliveries() in a worker thread, so commits never block the event
+    loop, never wait on slow leads, and never use the session concurrently.
+    Returns one result per lead, in order (exceptions included).
+    """
+    finished: asyncio.Queue = asyncio.Queue()
+
+    async def _deliver_and_queue(lead: Lead) -> dict | None:
+        delivery = await deliver(lead)
+        if delivery is not None:
+            finished.put_nowait(delivery)
+        return delivery
+
+    async def _checkpoint() -> None:
+        pending: list[dict] = []
+        while (delivery := await finished.get()) is not _DONE:
+            pending.append(delivery)
+            if len(pending) >= OUTREACH_COMMIT_EVERY:
+                await asyncio.to_thread(record_deliveries, db, pending)
+                pending = []
+        if pending:
+            await asyncio.to_thread(record_deliveries, db, pending)
+
+    checkpointer = asyncio.create_task(_checkpoint())
+    try:
+        results = await gather_bounded(
+            (_deliver_and_queue(lead) for lead in leads), concurrency, return_exceptions=True,
+        )
+    finally:
+        # Whatever has finished still gets recorded, even if we were cancelled
+        finished.put_nowait(_DONE)
+        await checkpointer
+    return results
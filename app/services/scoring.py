@@ -27,20 +27,21 @@ def is_lead_qualified(result: QualificationResult) -> bool:
     Returns:
         True if the lead should be saved and outreached.
     """
-    passes_score = result.relevance_score >= settings.min_relevance_score
-    passes_flag = result.is_qualified
-
-    if not passes_flag:
-        logger.debug("Lead rejected — LLM flagged as not qualified.")
-    elif not passes_score:
-        logger.debug(
-            "Lead rejected — score %.1f below threshold %d.",
-            result.relevance_score, settings.min_relevance_score,
-        )
-    else:
-        logger.debug(
-            "Lead qualified — score=%.1f, threshold=%d.",
-            result.relevance_score, settings.min_relevance_score,
-        )
-
-    return passes_flag and passes_score
+    # Cheap flag check first; debug logging is guarded because this runs per posting
+    if not result.is_qualified:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Lead rejected — LLM flagged as not qualified.")
+        return False
+
+    threshold = settings.min_relevance_score
+    if result.relevance_score < threshold:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Lead rejected — score %.1f below threshold %d.",
+                result.relevance_score, threshold,
+            )
+        return False
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Lead qualified — score=%.1f, threshold=%d.", result.relevance_score, threshold)
+    return True
@@ -25,11 +25,7 @@ from app.ingestion.fetcher import fetch_jobs
 from app.ingestion.normalizer import normalize_jobs
 from app.ingestion.filters import apply_filters
 from app.db.session import get_session
-from app.db.repository import (
-    get_or_create_company,
-    job_posting_exists,
-    save_job_posting,
-)
+from app.db.repository import store_new_postings
 
 
 def run(limit: int, use_ai: bool) -> None:
@@ -63,19 +59,11 @@ def run(limit: int, use_ai: bool) -> None:
 
     # ── Step 4: Save to DB ────────────────────────────────────
     print(f"\n[4/4] 💾 Saving new job postings to database...")
-    saved = 0
-    skipped = 0
 
+    # One session, one commit — same save step as POST /ingestion/run
     with get_session() as db:
-        for job in filtered:
-            # Dedup: skip if this URL already exists in DB
-            if job.job_url and job_posting_exists(db, job.job_url):
-                skipped += 1
-                continue
-
-            company = get_or_create_company(db, job)
-            save_job_posting(db, job, company)
-            saved += 1
+        saved = store_new_postings(db, filtered)
+    skipped = len(filtered) - saved
 
     print(f"      ✅ Saved {saved} new postings. Skipped {skipped} duplicates.")
 
@@ -3,16 +3,21 @@ scripts/run_outreach.py — CLI to run the email outreach pipeline.
 
 Steps:
   1. Fetch qualified-but-not-emailed leads from DB
-  2. Generate a personalized cold email via LLM (draft_email chain)
+  2. Generate personalized cold emails via LLM (adraft_email chain)
   3. Render the email into HTML + plain-text
   4. Send via Gmail SMTP (or print if MAILER_DRY_RUN=true)
   5. Update lead status to EMAILED and log delivery in DB
 
+Steps 2-4 run per lead as a pipeline: up to LLM_CONCURRENCY leads are in
+flight at once, and each email goes out as soon as its own draft is ready.
+Step 5 then writes every outcome in one go.
+
 Usage:
     python scripts/run_outreach.py [--limit N] [--dry-run] [--no-dry-run]
 """
 
 import argparse
+import asyncio
 import logging
 import sys
 import os
@@ -29,31 +34,72 @@ logger = logging.getLogger(__name__)
 
 from app.config import settings
 from app.db.session import get_session
-from app.db.repository import (
-    get_leads_for_outreach,
-    update_lead_status,
-)
-from app.db.models import LeadStatus
-from app.ai_engine.processor import draft_email
+from app.db.repository import get_leads_for_outreach
+from app.db.models import DeliveryStatus
+from app.ai_engine.processor import adraft_email
 from app.outreach.templates import render_email
 from app.outreach.mailer import GmailMailer
+from app.services.outreach_service import adeliver_with_checkpoints, draft_kwargs_for_lead
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def _build_lead_context(lead) -> dict:
-    """Extract a readable context dict from a Lead ORM object."""
-    company = lead.company
-    posting = lead.job_posting
-    return {
-        "company_name": company.name if company else "Unknown",
-        "job_title": posting.title if posting else "Unknown",
-        "job_description": (posting.description[:800] if posting else ""),
-        "company_domain": company.domain if company else "",
-        "contact_role": lead.contact_role or "Engineering Leader",
-        "company_pain_points": lead.company_pain_points or "[]",
-        "reason": lead.reason or "",
-    }
+async def _draft_and_send(lead, to_address: str, mailer: GmailMailer, summary: dict) -> dict | None:
+    """
+    Draft, render and send one lead's email, updating summary in place.
+
+    Returns the mailer's delivery row (or None if drafting failed); the DB
+    is written by the caller.
+    """
+    company_name = lead.company.name if lead.company else "Unknown"
+    logger.info(
+        "Processing lead %d — %s @ %s",
+        lead.id, lead.contact_role, company_name,
+    )
+
+    # 1. Generate personalized email via LLM
+    try:
+        draft = await adraft_email(**draft_kwargs_for_lead(lead))
+    except Exception as exc:
+        logger.error("LLM draft failed for lead %d: %s", lead.id, exc)
+        summary["failed"] += 1
+        return None
+
+    # 2. Render email
+    rendered = render_email(
+        subject=draft.subject,
+        plain_body=draft.body,
+        sender_name=settings.gmail_user.split("@")[0].capitalize(),
+    )
+
+    # 3. Send (or dry-run print)
+    delivery = await mailer.adeliver(lead.id, to_address, rendered)
+    if delivery["delivery_status"] == DeliveryStatus.SENT:
+        summary["sent"] += 1
+    else:
+        summary["failed"] += 1
+    return delivery
+
+
+async def _draft_and_send_all(leads: list, recipients: dict, mailer: GmailMailer, db, summary: dict) -> None:
+    """
+    Pipeline the batch: each lead's email is sent as soon as its draft is
+    ready, while other drafts are still being generated (up to
+    LLM_CONCURRENCY leads in flight), instead of drafting everything first.
+    The email log and EMAILED statuses are committed every
+    OUTREACH_COMMIT_EVERY finished leads from a worker thread.
+    """
+    # One logged-in SMTP session pool for the whole batch instead of one login per email
+    async with mailer:
+        results = await adeliver_with_checkpoints(
+            db, leads,
+            lambda lead: _draft_and_send(lead, recipients[lead.id], mailer, summary),
+            settings.llm_concurrency,
+        )
+    for lead, result in zip(leads, results):
+        if isinstance(result, BaseException):
+            logger.error("Outreach failed for lead %d: %s", lead.id, result)
+            summary["failed"] += 1
 
 
 # ── Main pipeline ─────────────────────────────────────────────────────────────
@@ -68,7 +114,7 @@ def run_outreach(limit: int, dry_run: bool) -> dict:
     summary = {"attempted": 0, "sent": 0, "failed": 0, "skipped": 0}
 
     with get_session() as db:
-        leads = get_leads_for_outreach(db, limit=limit)
+        leads = get_leads_for_outreach(db, limit=limit, min_score=settings.min_relevance_score)
 
         if not leads:
             logger.info("No qualified leads pending outreach.")
@@ -76,65 +122,23 @@ def run_outreach(limit: int, dry_run: bool) -> dict:
 
         logger.info("Found %d leads to contact.", len(leads))
 
+        recipients = {}
         for lead in leads:
             summary["attempted"] += 1
-            company = lead.company
-            company_name = company.name if company else "Unknown"
 
             # Determine recipient email — use company domain as fallback hint
             to_address = _resolve_to_address(lead)
             if not to_address:
                 logger.warning(
                     "No email address for lead %d (%s) — skipping.",
-                    lead.id, company_name,
+                    lead.id, lead.company.name if lead.company else "Unknown",
                 )
                 summary["skipped"] += 1
                 continue
+            recipients[lead.id] = to_address
 
-            logger.info(
-                "Processing lead %d — %s @ %s",
-                lead.id, lead.contact_role, company_name,
-            )
-
-            # 1. Generate personalized email via LLM
-            try:
-                context = _build_lead_context(lead)
-                draft = draft_email(
-                    company_name=context["company_name"],
-                    job_title=context["job_title"],
-                    job_description=context["job_description"],
-                    contact_role=context["contact_role"],
-                    company_pain_points=context["company_pain_points"],
-                    reason=context["reason"],
-                    product_description=settings.product_description,
-                )
-            except Exception as exc:
-                logger.error("LLM draft failed for lead %d: %s", lead.id, exc)
-                summary["failed"] += 1
-                continue
-
-            # 2. Render email
-            rendered = render_email(
-                subject=draft.subject,
-                plain_body=draft.body,
-                sender_name=settings.gmail_user.split("@")[0].capitalize(),
-            )
-
-            # 3. Send (or dry-run print)
-            success = mailer.send(
-                db=db,
-                lead_id=lead.id,
-                to_address=to_address,
-                email=rendered,
-            )
-
-            # 4. Update lead status
-            if success:
-                update_lead_status(db, lead.id, LeadStatus.EMAILED)
-                db.commit()
-                summary["sent"] += 1
-            else:
-                summary["failed"] += 1
+        to_contact = [lead for lead in leads if lead.id in recipients]
+        asyncio.run(_draft_and_send_all(to_contact, recipients, mailer, db, summary))
 
     return summary
 
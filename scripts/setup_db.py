@@ -15,7 +15,7 @@ import os
 # Ensure the project root is on the path so we can import `app`
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from sqlalchemy import inspect, text
+from sqlalchemy import Enum, inspect, text
 
 from app.db.session import engine
 from app.db.models import Base
@@ -33,6 +33,33 @@ def setup_db() -> None:
     print("\n📦 Creating tables if they don't exist...")
     Base.metadata.create_all(bind=engine)
 
+    # create_all skips tables that already exist, so add any newer indexes too
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+    # ...and move timestamp columns created before they were timezone-aware
+    # to timestamptz (stored values were UTC), and native enum columns to varchar
+    if engine.dialect.name == "postgresql":
+        inspector = inspect(engine)
+        with engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                existing = {c["name"]: c["type"] for c in inspector.get_columns(table.name)}
+                for col in table.columns:
+                    if getattr(col.type, "timezone", False) and not getattr(existing.get(col.name), "timezone", True):
+                        conn.execute(text(
+                            f'ALTER TABLE {table.name} ALTER COLUMN {col.name} '
+                            f"TYPE TIMESTAMPTZ USING {col.name} AT TIME ZONE 'UTC'"
+                        ))
+                        print(f"   ↻ {table.name}.{col.name} → timestamptz")
+                    # Status columns are plain VARCHARs now, not PostgreSQL ENUM types
+                    if isinstance(col.type, Enum) and isinstance(existing.get(col.name), Enum):
+                        conn.execute(text(
+                            f"ALTER TABLE {table.name} ALTER COLUMN {col.name} "
+                            f"TYPE VARCHAR({col.type.length}) USING {col.name}::text"
+                        ))
+                        print(f"   ↻ {table.name}.{col.name} → varchar")
+
     # Report which tables were found
     inspector = inspect(engine)
     tables = inspector.get_table_names()
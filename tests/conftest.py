@@ -16,3 +16,4 @@ os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
 os.environ.setdefault("GMAIL_USER", "test@example.com")
 os.environ.setdefault("GMAIL_APP_PASSWORD", "test-password")
 os.environ.setdefault("PRODUCT_DESCRIPTION", "A test product for unit tests.")
+os.environ.setdefault("LLM_CACHE_ENABLED", "false")
@@ -6,17 +6,27 @@ The processor functions (generate_keywords, qualify_lead, draft_email) are
 tested with mocked LLM responses to keep tests fast and free.
 """
 
+import asyncio
 import json
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from app.ai_engine.utils import parse_json_safely, truncate_for_context
+from app.ai_engine.utils import (
+    build_openrouter_llm,
+    gather_bounded,
+    parse_json_safely,
+    truncate_for_context,
+)
 from app.ai_engine.processor import (
     QualificationResult,
     EmailDraft,
     qualify_lead,
+    aqualify_lead,
+    aqualify_leads_batch,
+    qualify_leads_batch,
     draft_email,
     generate_keywords,
+    astream_email_draft,
 )
 from app.services.scoring import is_lead_qualified
 
@@ -44,11 +54,30 @@ class TestParseJsonSafely:
         result = parse_json_safely(text)
         assert result == {"key": "value"}
 
+    def test_fence_inside_prose(self):
+        text = 'Sure!\n```json\n{"key": "value"}\n```\nLet me know if you need more.'
+        assert parse_json_safely(text) == {"key": "value"}
+
+    def test_fence_language_tag_case_insensitive(self):
+        assert parse_json_safely('```JSON\n["cto"]\n```') == ["cto"]
+
     def test_extracts_json_from_surrounding_text(self):
         text = 'Here is the result:\n{"score": 75}\nDone.'
         result = parse_json_safely(text)
         assert result == {"score": 75}
 
+    def test_ignores_trailing_prose_with_braces(self):
+        text = '{"score": 75}\nNote: scores {0-100} are approximate}'
+        assert parse_json_safely(text) == {"score": 75}
+
+    def test_skips_invalid_object_before_valid_one(self):
+        text = 'Answer: {"Answer": YES}. Final: {"score": 40}'
+        assert parse_json_safely(text) == {"score": 40}
+
+    def test_brackets_inside_strings_are_ignored(self):
+        text = 'Result: {"reason": "uses } and ] and \\" quotes"} done'
+        assert parse_json_safely(text) == {"reason": 'uses } and ] and " quotes'}
+
     def test_returns_none_for_invalid_json(self):
         result = parse_json_safely("This is not JSON at all.")
         assert result is None
@@ -62,6 +91,25 @@ class TestParseJsonSafely:
         assert result is None
 
 
+# ── build_openrouter_llm ──────────────────────────────────────────────────────
+
+class TestBuildOpenRouterLLM:
+    def test_same_temperature_reuses_client(self):
+        assert build_openrouter_llm(temperature=0.1) is build_openrouter_llm(temperature=0.1)
+
+    def test_cached_client_shares_http_connection_pool(self):
+        first = build_openrouter_llm(temperature=0.1)
+        again = build_openrouter_llm(temperature=0.1)
+        assert first.root_client._client is again.root_client._client
+        assert first.root_async_client._client is again.root_async_client._client
+
+    def test_different_temperatures_get_separate_clients(self):
+        low = build_openrouter_llm(temperature=0.1)
+        high = build_openrouter_llm(temperature=0.7)
+        assert low is not high
+        assert high.temperature == 0.7
+
+
 # ── truncate_for_context ──────────────────────────────────────────────────────
 
 class TestTruncateForContext:
@@ -86,6 +134,39 @@ class TestTruncateForContext:
         assert truncate_for_context(None, max_chars=100) == ""
 
 
+# ── gather_bounded ────────────────────────────────────────────────────────────
+
+class TestGatherBounded:
+    @pytest.mark.asyncio
+    async def test_caps_in_flight_and_keeps_order(self):
+        in_flight = peak = 0
+
+        async def work(n: int) -> int:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return n * 2
+
+        results = await gather_bounded((work(n) for n in range(6)), limit=2)
+
+        assert results == [0, 2, 4, 6, 8, 10]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_return_exceptions(self):
+        async def fail():
+            raise ValueError("boom")
+
+        async def ok():
+            return "ok"
+
+        results = await gather_bounded([ok(), fail()], limit=1, return_exceptions=True)
+        assert results[0] == "ok"
+        assert isinstance(results[1], ValueError)
+
+
 # ── qualify_lead (mocked LLM) ─────────────────────────────────────────────────
 
 class TestQualifyLead:
@@ -145,6 +226,349 @@ class TestQualifyLead:
         assert result.is_qualified is False
         assert result.relevance_score == 0.0
 
+    @patch("app.ai_engine.processor.build_openrouter_llm")
+    def test_requests_json_object_mode(self, mock_build_llm):
+        """The qualification chain asks the provider for a JSON object response."""
+        mock_chain = MagicMock()
+        mock_chain.invoke.return_value = self._mock_llm_response('{"is_qualified": false}')
+
+        with patch("app.ai_engine.processor.LEAD_QUALIFICATION_PROMPT") as mock_prompt:
+            mock_prompt.__or__ = MagicMock(return_value=mock_chain)
+            qualify_lead(
+                company_name="JsonCo",
+                job_title="CTO",
+                job_description="",
+                location="Remote",
+                product_description="A tool.",
+            )
+
+        mock_build_llm.return_value.bind.assert_called_once_with(
+            response_format={"type": "json_object"}
+        )
+
+    @pytest.mark.asyncio
+    @patch("app.ai_engine.processor.build_openrouter_llm")
+    async def test_async_qualification_awaits_chain(self, mock_build_llm):
+        """aqualify_lead awaits chain.ainvoke and parses the same way as qualify_lead."""
+        llm_response = json.dumps({
+            "is_qualified": True,
+            "relevance_score": 70,
+            "reason": "Growing platform team.",
+            "target_contact_role": "CTO",
+            "company_pain_points": ["deploy speed"],
+        })
+        mock_chain = MagicMock()
+        mock_chain.ainvoke = AsyncMock(return_value=self._mock_llm_response(llm_response))
+        mock_build_llm.return_value = MagicMock()
+
+        with patch("app.ai_engine.processor.LEAD_QUALIFICATION_PROMPT") as mock_prompt:
+            mock_prompt.__or__ = MagicMock(return_value=mock_chain)
+            result = await aqualify_lead(
+                company_name="AsyncCo",
+                job_title="Platform Engineer",
+                job_description="Kubernetes everywhere.",
+                location="Remote",
+                product_description="A deploy tool.",
+            )
+
+        mock_chain.ainvoke.assert_awaited_once()
+        mock_chain.invoke.assert_not_called()
+        assert result.relevance_score == 70.0
+        assert result.company_pain_points == ["deploy speed"]
+
+
+# ── generate_keywords (mocked LLM) ───────────────────────────────────────────
+
+class TestGenerateKeywords:
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        from app.ai_engine import processor
+        processor._KEYWORD_CACHE.clear()
+        yield
+        processor._KEYWORD_CACHE.clear()
+
+    @patch("app.ai_engine.processor.build_openrouter_llm")
+    def test_repeat_calls_hit_cache(self, mock_build_llm):
+        """Same product description twice → only one LLM call."""
+        mock_chain = MagicMock()
+        mock_chain.invoke.return_value = MagicMock(content='["CTO", "vp engineering"]')
+        mock_build_llm.return_value = MagicMock()
+
+        with patch("app.ai_engine.processor.KEYWORD_GENERATION_PROMPT") as mock_prompt:
+            mock_prompt.__or__ = MagicMock(return_value=mock_chain)
+            first = generate_keywords("A code review tool.")
+            second = generate_keywords("A code review tool.")
+
+        assert first == second == ["cto", "vp engineering"]
+        mock_chain.invoke.assert_called_once()
+
+    @patch("app.ai_engine.processor.build_openrouter_llm")
+    def test_unparseable_response_is_not_cached(self, mock_build_llm):
+        mock_chain = MagicMock()
+        mock_chain.invoke.return_value = MagicMock(content="no keywords here")
+        mock_build_llm.return_value = MagicMock()
+
+        with patch("app.ai_engine.processor.KEYWORD_GENERATION_PROMPT") as mock_prompt:
+            mock_prompt.__or__ = MagicMock(return_value=mock_chain)
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    generate_keywords("A code review tool.")
+
+        assert mock_chain.invoke.call_count == 2
+
+
+# ── astream_email_draft (mocked LLM) ─────────────────────────────────────────
+
+class TestStreamEmailDraft:
+    @pytest.mark.asyncio
+    @patch("app.ai_engine.processor.build_openrouter_llm")
+    async def test_yields_chunks_in_order(self, mock_build_llm):
+        async def fake_stream(_inputs):
+            for piece in ('{"subject": ', "", '"Hi"}'):
+                yield MagicMock(content=piece)
+
+        mock_chain = MagicMock()
+        mock_chain.astream = fake_stream
+        mock_build_llm.return_value = MagicMock()
+
+        with patch("app.ai_engine.processor.EMAIL_DRAFT_PROMPT") as mock_prompt:
+            mock_prompt.__or__ = MagicMock(return_value=mock_chain)
+            chunks = [
+                chunk async for chunk in astream_email_draft(
+                    company_name="StreamCo",
+                    job_title="CTO",
+                    contact_role="CEO",
+                    reason="Fit.",
+                    pain_points=[],
+                    product_description="A tool.",
+                )
+            ]
+
+        assert chunks == ['{"subject": ', '"Hi"}']
+
+
+# ── qualify_leads_batch (mocked LLM) ─────────────────────────────────────────
+
+class TestQualifyLeadsBatch:
+    JOBS = [
+        {"company_name": "Alpha", "job_title": "CTO", "job_description": "", "location": "Remote"},
+        {"company_name": "Beta", "job_title": "VP Eng", "job_description": "", "location": "NYC"},
+    ]
+
+    def _entry(self, position: int, score: int) -> dict:
+        return {
+            "id": position,
+            "is_qualified": True,
+            "relevance_score": score,
+            "reason": "Fit.",
+            "target_contact_role": "CTO",
+            "company_pain_points": [],
+        }
+
+    @patch("app.ai_engine.processor.build_openrouter_llm")
+    def test_one_request_demultiplexed_by_id(self, mock_build_llm):
+        """Results come back out of order and are mapped to jobs by id."""
+        mock_chain = MagicMock()
+        mock_chain.invoke.return_value = MagicMock(content=json.dumps(
+            {"results": [self._entry(1, 65), self._entry(0, 90)]}
+        ))
+
+        with patch("app.ai_engine.processor.LEAD_QUALIFICATION_BATCH_PROMPT") as mock_prompt:
+            mock_prompt.__or__ = MagicMock(return_value=mock_chain)
+            results = qualify_leads_batch(self.JOBS, product_description="A tool.")
+
+        mock_chain.invoke.assert_called_once()
+        postings = json.loads(mock_chain.invoke.call_args.args[0]["job_postings"])
+        assert [p["company"] for p in postings] == ["Alpha", "Beta"]
+        assert [r.relevance_score for r in results] == [90.0, 65.0]
+
+    @patch("app.ai_engine.processor.build_openrouter_llm")
+    def test_missing_entries_fall_back_to_single_calls(self, mock_build_llm):
+        batch_chain = MagicMock()
+        batch_chain.invoke.return_value = MagicMock(
+            content=json.dumps({"results": [self._entry(0, 90)]})
+        )
+        single_chain = MagicMock()
+        single_chain.invoke.return_value = MagicMock(
+            content=json.dumps({"is_qualified": False, "relevance_score": 20})
+        )
+
+        with patch("app.ai_engine.processor.LEAD_QUALIFICATION_BATCH_PROMPT") as batch_prompt, \
+                patch("app.ai_engine.processor.LEAD_QUALIFICATION_PROMPT") as single_prompt:
+            batch_prompt.__or__ = MagicMock(return_value=batch_chain)
+            single_prompt.__or__ = MagicMock(return_value=single_chain)
+            results = qualify_leads_batch(self.JOBS, product_description="A tool.")
+
+        single_chain.invoke.assert_called_once()
+        assert single_chain.invoke.call_args.args[0]["company_name"] == "Beta"
+        assert [r.relevance_score for r in results] == [90.0, 20.0]
+
+    @pytest.mark.asyncio
+    @patch("app.ai_engine.processor.build_openrouter_llm")
+    async def test_async_batch_awaits_single_request(self, mock_build_llm):
+        mock_chain = MagicMock()
+        mock_chain.ainvoke = AsyncMock(return_value=MagicMock(content=json.dumps(
+            {"results": [self._entry(0, 70), self._entry(1, 80)]}
+        )))
+
+        with patch("app.ai_engine.processor.LEAD_QUALIFICATION_BATCH_PROMPT") as mock_prompt:
+            mock_prompt.__or__ = MagicMock(return_value=mock_chain)
+            results = await aqualify_leads_batch(self.JOBS, product_description="A tool.")
+
+        mock_chain.ainvoke.assert_awaited_once()
+        assert [r.relevance_score for r in results] == [70.0, 80.0]
+
+
+# ── prompt caching breakpoints ────────────────────────────────────────────────
+
+class TestPromptCacheBreakpoint:
+    def test_qualification_static_prefix_is_cacheable(self):
+        from app.ai_engine.prompt_templates import LEAD_QUALIFICATION_PROMPT
+        system, human = LEAD_QUALIFICATION_PROMPT.invoke({
+            "product_description": "An AI code review tool.",
+            "company_name": "VolatileCo",
+            "job_title": "Staff Engineer",
+            "location": "Remote",
+            "job_description": "Posting-specific text.",
+        }).to_messages()
+
+        block = system.content[0]
+        assert block["cache_control"] == {"type": "ephemeral"}
+        assert "An AI code review tool." in block["text"]
+        assert "VolatileCo" not in block["text"]
+        assert "VolatileCo" in human.content
+
+    def test_email_static_prefix_is_cacheable(self):
+        from app.ai_engine.prompt_templates import EMAIL_DRAFT_PROMPT
+        system, human = EMAIL_DRAFT_PROMPT.invoke({
+            "product_description": "An AI code review tool.",
+            "company_name": "VolatileCo",
+            "job_title": "Staff Engineer",
+            "contact_role": "CTO",
+            "reason": "Big team.",
+            "pain_points": "- review latency",
+        }).to_messages()
+
+        assert system.content[0]["cache_control"] == {"type": "ephemeral"}
+        assert "VolatileCo" not in system.content[0]["text"]
+        assert "review latency" in human.content
+
+
+# ── LLM response cache ────────────────────────────────────────────────────────
+
+class TestLLMResponseCache:
+    @pytest.fixture(autouse=True)
+    def _enabled_cache(self, tmp_path, monkeypatch):
+        from app.ai_engine import cache
+        from app.config import settings
+        monkeypatch.setattr(settings, "llm_cache_enabled", True)
+        monkeypatch.setattr(settings, "llm_cache_dir", str(tmp_path / "llm"))
+        cache._get_cache.cache_clear()
+        yield
+        cache._get_cache().close()
+        cache._get_cache.cache_clear()
+
+    def _qualify(self):
+        return qualify_lead(
+            company_name="CacheCo",
+            job_title="Staff Engineer",
+            job_description="Monorepo, many reviewers.",
+            location="Remote",
+            product_description="An AI code review tool.",
+        )
+
+    @patch("app.ai_engine.processor.build_openrouter_llm")
+    def test_identical_qualification_inputs_call_llm_once(self, mock_build_llm):
+        llm_response = json.dumps({
+            "is_qualified": True,
+            "relevance_score": 75,
+            "reason": "Big team.",
+            "target_contact_role": "CTO",
+            "company_pain_points": ["review latency"],
+        })
+        mock_chain = MagicMock()
+        mock_chain.invoke.return_value = MagicMock(content=llm_response)
+        mock_build_llm.return_value = MagicMock()
+
+        with patch("app.ai_engine.processor.LEAD_QUALIFICATION_PROMPT") as mock_prompt:
+            mock_prompt.__or__ = MagicMock(return_value=mock_chain)
+            first = self._qualify()
+            second = self._qualify()
+
+        mock_chain.invoke.assert_called_once()
+        assert second == first
+
+    @patch("app.ai_engine.processor.build_openrouter_llm")
+    def test_model_change_misses_cache(self, mock_build_llm, monkeypatch):
+        from app.config import settings
+        mock_chain = MagicMock()
+        mock_chain.invoke.return_value = MagicMock(
+            content='{"is_qualified": false, "relevance_score": 10}'
+        )
+
+        with patch("app.ai_engine.processor.LEAD_QUALIFICATION_PROMPT") as mock_prompt:
+            mock_prompt.__or__ = MagicMock(return_value=mock_chain)
+            self._qualify()
+            monkeypatch.setattr(settings, "openrouter_model", "another/model")
+            self._qualify()
+
+        assert mock_chain.invoke.call_count == 2
+
+    @patch("app.ai_engine.processor.build_openrouter_llm")
+    def test_unparseable_qualification_is_not_cached(self, mock_build_llm):
+        mock_chain = MagicMock()
+        mock_chain.invoke.return_value = MagicMock(content="Sorry, I cannot help.")
+        mock_build_llm.return_value = MagicMock()
+
+        with patch("app.ai_engine.processor.LEAD_QUALIFICATION_PROMPT") as mock_prompt:
+            mock_prompt.__or__ = MagicMock(return_value=mock_chain)
+            self._qualify()
+            self._qualify()
+
+        assert mock_chain.invoke.call_count == 2
+
+    @patch("app.ai_engine.processor.build_openrouter_llm")
+    def test_email_draft_cached(self, mock_build_llm):
+        mock_chain = MagicMock()
+        mock_chain.invoke.return_value = MagicMock(
+            content=json.dumps({"subject": "Hi", "body": "Hello there"})
+        )
+        mock_build_llm.return_value = MagicMock()
+
+        with patch("app.ai_engine.processor.EMAIL_DRAFT_PROMPT") as mock_prompt:
+            mock_prompt.__or__ = MagicMock(return_value=mock_chain)
+            drafts = [
+                draft_email(
+                    company_name="CacheCo",
+                    job_title="Staff Engineer",
+                    contact_role="CTO",
+                    reason="Big team.",
+                    pain_points=["review latency"],
+                    product_description="An AI code review tool.",
+                )
+                for _ in range(2)
+            ]
+
+        mock_chain.invoke.assert_called_once()
+        assert drafts[0] == drafts[1]
+        assert drafts[1].subject == "Hi"
+
+    @patch("app.ai_engine.processor.build_openrouter_llm")
+    def test_keywords_survive_process_restart(self, mock_build_llm, monkeypatch):
+        from app.ai_engine import processor
+        monkeypatch.setattr(processor, "_KEYWORD_CACHE", {})
+        mock_chain = MagicMock()
+        mock_chain.invoke.return_value = MagicMock(content='["CTO", "vp engineering"]')
+
+        with patch("app.ai_engine.processor.KEYWORD_GENERATION_PROMPT") as mock_prompt:
+            mock_prompt.__or__ = MagicMock(return_value=mock_chain)
+            first = generate_keywords("A code review tool.")
+            processor._KEYWORD_CACHE.clear()   # new process: only the disk cache is left
+            second = generate_keywords("A code review tool.")
+
+        mock_chain.invoke.assert_called_once()
+        assert first == second == ["cto", "vp engineering"]
+
 
 # ── scoring ───────────────────────────────────────────────────────────────────
 
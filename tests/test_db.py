@@ -11,59 +11,85 @@ preventing pydantic-settings from failing on missing required fields.
 import pytest
 import sqlalchemy
 from datetime import datetime, timezone
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
-from app.db.models import Base, Lead, LeadStatus
+from app.db.models import Base, Company, DeliveryStatus, Lead, LeadStatus
 from app.db.repository import (
     get_or_create_company,
+    get_or_create_companies,
     save_job_posting,
+    save_job_postings_bulk,
+    store_new_postings,
     job_posting_exists,
+    existing_posting_urls,
     get_unprocessed_postings,
+    count_unprocessed_postings,
     mark_posting_processed,
+    mark_postings_processed,
     create_lead,
+    create_leads_bulk,
     update_lead_status,
+    update_leads_status,
     get_leads_for_outreach,
+    leads_version,
+    log_outreach_email,
+    log_outreach_emails_bulk,
+    outreach_emails_version,
+    update_email_delivery_status,
 )
 from app.ingestion.normalizer import NormalizedJob
+from app.services.outreach_service import record_deliveries
 
 
 # ── In-memory DB Fixture ──────────────────────────────────────────────────────
 
-@pytest.fixture
-def db():
-    """
-    Provide a fresh in-memory SQLite session for each test.
-
-    SQLite doesn't support PostgreSQL native ENUMs, so we temporarily
-    set native_enum=False on all Enum columns before creating tables.
-    """
-    import sqlalchemy as sa
-
-    # Patch: disable native enums for SQLite compatibility
-    for table in Base.metadata.tables.values():
-        for col in table.columns:
-            if isinstance(col.type, sa.Enum):
-                col.type.native_enum = False
-
+@pytest.fixture(scope="module")
+def engine():
+    """One in-memory SQLite database for the whole module, schema created once."""
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
+
+    # pysqlite's own transaction handling breaks SAVEPOINTs — let SQLAlchemy
+    # emit BEGIN itself (recipe from the SQLAlchemy SQLite dialect docs)
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    try:
+        yield engine
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    """
+    Provide an isolated session for each test.
+
+    Everything runs inside an outer transaction that is rolled back
+    afterwards; the session's own commits become SAVEPOINT releases.
+    """
+    connection = engine.connect()
+    outer = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
 
     try:
         yield session
     finally:
         session.close()
-        Base.metadata.drop_all(engine)
-        # Restore native_enum so production code is unaffected
-        for table in Base.metadata.tables.values():
-            for col in table.columns:
-                if isinstance(col.type, sa.Enum):
-                    col.type.native_enum = True
+        outer.rollback()
+        connection.close()
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -99,6 +125,34 @@ def make_company_and_posting(db, job: NormalizedJob = None):
     return company, posting
 
 
+def make_lead(db, job: NormalizedJob = None):
+    """Helper: a qualified Lead on the company and posting for a NormalizedJob."""
+    company, posting = make_company_and_posting(db, job)
+    return create_lead(
+        db=db, company=company, posting=posting,
+        relevance_score=70.0, ai_analysis="{}", reason="Fit.",
+        contact_role="CTO", company_pain_points="[]",
+    )
+
+
+def seed_postings(db, n: int) -> None:
+    """Helper: store n postings, each at its own company, with two bulk INSERTs."""
+    jobs = [
+        make_normalized_job(
+            title=f"Job {i}",
+            job_url=f"https://remoteok.com/jobs/{i}",
+            external_id=f"ID-{i}",
+            company_name=f"Company {i}",
+            company_domain=f"company{i}.com",
+        )
+        for i in range(n)
+    ]
+    companies = get_or_create_companies(db, jobs)
+    save_job_postings_bulk(
+        db, [(job, companies[(job.company_domain, job.company_name)]) for job in jobs],
+    )
+
+
 # ── get_or_create_company ─────────────────────────────────────────────────────
 
 class TestGetOrCreateCompany:
@@ -124,6 +178,50 @@ class TestGetOrCreateCompany:
         assert c1.id != c2.id
 
 
+class TestGetOrCreateCompanies:
+    def test_creates_each_company_once(self, db):
+        jobs = [
+            make_normalized_job(company_name="Alpha", company_domain="alpha.com"),
+            make_normalized_job(company_name="Alpha", company_domain="alpha.com"),
+            make_normalized_job(company_name="NoDomain Inc", company_domain=None),
+        ]
+        companies = get_or_create_companies(db, jobs)
+        assert set(companies) == {("alpha.com", "Alpha"), (None, "NoDomain Inc")}
+        assert all(c.id is not None for c in companies.values())
+        assert db.query(Company).count() == 2
+
+    def test_reuses_existing_by_domain_then_name(self, db):
+        by_domain = get_or_create_company(db, make_normalized_job(company_name="Beta", company_domain="beta.com"))
+        by_name = get_or_create_company(db, make_normalized_job(company_name="Gamma", company_domain=None))
+        companies = get_or_create_companies(db, [
+            make_normalized_job(company_name="Beta Renamed", company_domain="beta.com"),
+            make_normalized_job(company_name="Gamma", company_domain="gamma.io"),
+        ])
+        assert companies[("beta.com", "Beta Renamed")].id == by_domain.id
+        assert companies[("gamma.io", "Gamma")].id == by_name.id
+        assert db.query(Company).count() == 2
+
+    def test_query_count_independent_of_batch_size(self, db):
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            # The fixture's SAVEPOINT bookkeeping isn't repository work
+            if not statement.startswith(("SAVEPOINT", "RELEASE SAVEPOINT")):
+                statements.append(statement)
+
+        sqlalchemy.event.listen(db.get_bind(), "before_cursor_execute", record)
+        jobs = [
+            make_normalized_job(company_name=f"Co{i}", company_domain=f"co{i}.com")
+            for i in range(20)
+        ]
+        get_or_create_companies(db, jobs)
+        assert db.query(Company).count() == 20
+        assert len(statements) <= 5
+
+    def test_empty_input(self, db):
+        assert get_or_create_companies(db, []) == {}
+
+
 # ── save_job_posting / job_posting_exists ─────────────────────────────────────
 
 class TestJobPosting:
@@ -147,6 +245,50 @@ class TestJobPosting:
         assert posting.company_id == company.id
 
 
+# ── existing_posting_urls / save_job_postings_bulk ────────────────────────────
+
+class TestBulkJobPostings:
+    def test_existing_posting_urls_returns_only_stored(self, db):
+        make_company_and_posting(db, make_normalized_job(job_url="https://remoteok.com/jobs/1"))
+        found = existing_posting_urls(db, ["https://remoteok.com/jobs/1", "https://remoteok.com/jobs/2"])
+        assert found == {"https://remoteok.com/jobs/1"}
+
+    def test_existing_posting_urls_empty_input(self, db):
+        assert existing_posting_urls(db, []) == set()
+
+    def test_bulk_save_inserts_all(self, db):
+        jobs = [make_normalized_job(job_url=f"https://remoteok.com/jobs/{i}") for i in range(3)]
+        company = get_or_create_company(db, jobs[0])
+        assert save_job_postings_bulk(db, [(job, company) for job in jobs]) == 3
+        assert len(get_unprocessed_postings(db)) == 3
+
+    def test_bulk_save_skips_existing_urls(self, db):
+        company, _ = make_company_and_posting(db, make_normalized_job(job_url="https://remoteok.com/jobs/1"))
+        jobs = [make_normalized_job(job_url=f"https://remoteok.com/jobs/{i}") for i in (1, 2)]
+        assert save_job_postings_bulk(db, [(job, company) for job in jobs]) == 1
+        assert len(get_unprocessed_postings(db)) == 2
+
+    def test_bulk_save_empty_is_noop(self, db):
+        assert save_job_postings_bulk(db, []) == 0
+
+    def test_store_new_postings_links_each_job_to_its_company(self, db):
+        existing = get_or_create_company(db, make_normalized_job(company_name="Alpha", company_domain="alpha.com"))
+        jobs = [
+            make_normalized_job(company_name="Alpha", company_domain="alpha.com", job_url="https://remoteok.com/jobs/1"),
+            make_normalized_job(company_name="Beta", company_domain="beta.com", job_url="https://remoteok.com/jobs/2"),
+        ]
+        assert store_new_postings(db, jobs) == 2
+        by_url = {p.url: p.company.name for p in get_unprocessed_postings(db)}
+        assert by_url == {"https://remoteok.com/jobs/1": "Alpha", "https://remoteok.com/jobs/2": "Beta"}
+        assert get_or_create_company(db, jobs[0]).id == existing.id
+
+    def test_store_new_postings_skips_stored_and_repeated_urls(self, db):
+        make_company_and_posting(db, make_normalized_job(job_url="https://remoteok.com/jobs/1"))
+        jobs = [make_normalized_job(job_url=f"https://remoteok.com/jobs/{i}") for i in (1, 2, 2, 3)]
+        assert store_new_postings(db, jobs) == 2
+        assert len(get_unprocessed_postings(db)) == 3
+
+
 # ── get_unprocessed_postings / mark_posting_processed ────────────────────────
 
 class TestProcessingFlow:
@@ -162,18 +304,35 @@ class TestProcessingFlow:
         assert len(results) == 0
 
     def test_limit_is_respected(self, db):
-        for i in range(5):
-            job = make_normalized_job(
-                title=f"Job {i}",
-                job_url=f"https://remoteok.com/jobs/{i}",
-                external_id=f"ID-{i}",
-                company_domain=f"company{i}.com",
-            )
-            company = get_or_create_company(db, job)
-            save_job_posting(db, job, company)
+        seed_postings(db, 5)
         results = get_unprocessed_postings(db, limit=3)
         assert len(results) == 3
 
+    def test_unprocessed_postings_eager_load_company(self, db):
+        make_company_and_posting(db)
+        db.commit()
+        db.expunge_all()
+
+        posting = get_unprocessed_postings(db, limit=10)[0]
+        assert "company" not in sqlalchemy.inspect(posting).unloaded
+
+    def test_queue_query_uses_partial_index(self, db):
+        statements = []
+        sqlalchemy.event.listen(db.get_bind(), "before_cursor_execute",
+                                lambda *args: statements.append((args[2], args[3])))
+        get_unprocessed_postings(db, limit=5)
+        statement, params = statements[-1]
+        plan = db.connection().exec_driver_sql("EXPLAIN QUERY PLAN " + statement, params).all()
+        assert any("ix_job_postings_unprocessed_created" in row[-1] for row in plan)
+
+    def test_count_unprocessed_postings(self, db):
+        for i in range(4):
+            make_company_and_posting(db, make_normalized_job(job_url=f"https://remoteok.com/jobs/{i}"))
+        _, done = make_company_and_posting(db, make_normalized_job(job_url="https://remoteok.com/jobs/done"))
+        mark_posting_processed(db, done.id)
+        assert count_unprocessed_postings(db) == 4
+        assert count_unprocessed_postings(db, limit=2) == 2
+
 
 # ── create_lead / update_lead_status / get_leads_for_outreach ────────────────
 
@@ -215,6 +374,41 @@ class TestLeads:
         leads = get_leads_for_outreach(db, limit=10)
         assert len(leads) == 0
 
+    def test_bulk_create_leads_and_mark_processed(self, db):
+        rows, ids = [], []
+        for i in range(3):
+            company, posting = make_company_and_posting(db, make_normalized_job(
+                company_name=f"Co{i}", company_domain=f"co{i}.com", job_url=f"https://x/{i}",
+            ))
+            ids.append(posting.id)
+            rows.append({
+                "company_id": company.id, "job_posting_id": posting.id,
+                "relevance_score": 70.0 + i, "ai_analysis": "{}", "reason": "Fit.",
+                "contact_role": "CTO", "company_pain_points": "[]",
+            })
+        mark_postings_processed(db, ids[:2])
+        assert create_leads_bulk(db, rows[:2]) == 2
+        assert create_leads_bulk(db, []) == 0
+
+        assert [p.id for p in get_unprocessed_postings(db)] == ids[2:]
+        leads = get_leads_for_outreach(db, limit=10)
+        assert [lead.job_posting_id for lead in leads] == ids[:2]
+        assert all(lead.status == LeadStatus.QUALIFIED for lead in leads)
+
+    def test_outreach_queue_min_score(self, db):
+        for i, score in enumerate((55.0, 80.0)):
+            company, posting = make_company_and_posting(db, make_normalized_job(
+                company_name=f"Co{i}", company_domain=f"co{i}.com", job_url=f"https://x/{i}",
+            ))
+            create_lead(
+                db=db, company=company, posting=posting,
+                relevance_score=score, ai_analysis="{}", reason="Fit.",
+                contact_role="CTO", company_pain_points="[]",
+            )
+        assert len(get_leads_for_outreach(db, limit=10)) == 2
+        leads = get_leads_for_outreach(db, limit=10, min_score=60)
+        assert [lead.relevance_score for lead in leads] == [80.0]
+
     def test_update_lead_status(self, db):
         company, posting = make_company_and_posting(db)
         lead = create_lead(
@@ -225,3 +419,82 @@ class TestLeads:
         update_lead_status(db, lead.id, LeadStatus.REPLIED)
         db.refresh(lead)
         assert lead.status == LeadStatus.REPLIED
+
+    def test_outreach_queue_eager_loads_relations(self, db):
+        company, posting = make_company_and_posting(db)
+        create_lead(
+            db=db, company=company, posting=posting,
+            relevance_score=75.0, ai_analysis="{}", reason="Good fit.",
+            contact_role="CTO", company_pain_points="[]",
+        )
+        db.commit()
+        db.expunge_all()
+
+        lead = get_leads_for_outreach(db, limit=10)[0]
+        unloaded = sqlalchemy.inspect(lead).unloaded
+        assert "company" not in unloaded
+        assert "job_posting" not in unloaded
+
+
+# ── leads_version / outreach_emails_version (ETag fingerprints) ──────────────
+
+class TestTableVersions:
+    def test_leads_version_changes_on_new_lead(self, db):
+        before = leads_version(db)
+        make_lead(db)
+        assert leads_version(db) != before
+
+    def test_leads_version_stable_without_writes(self, db):
+        make_lead(db)
+        assert leads_version(db) == leads_version(db)
+
+    def test_outreach_version_changes_on_delivery_status(self, db):
+        lead = make_lead(db)
+        email = log_outreach_email(db, lead_id=lead.id, subject="Hi", body="Body")
+        pending = outreach_emails_version(db)
+        update_email_delivery_status(db, email.id, DeliveryStatus.SENT)
+        assert outreach_emails_version(db) != pending
+
+
+# ── Outreach emails ───────────────────────────────────────────────────────────
+
+class TestOutreachEmails:
+    def test_sent_at_set_when_marked_sent(self, db):
+        from app.db.models import OutreachEmail
+
+        lead = make_lead(db)
+        email = log_outreach_email(db, lead_id=lead.id, subject="Hi", body="Body")
+        assert email.sent_at is None
+        update_email_delivery_status(db, email.id, DeliveryStatus.SENT)
+        assert db.get(OutreachEmail, email.id).sent_at is not None
+
+    def test_logged_as_sent_uses_aware_timestamp(self, db):
+        lead = make_lead(db)
+        email = log_outreach_email(
+            db, lead_id=lead.id, subject="Hi", body="Body", delivery_status=DeliveryStatus.SENT,
+        )
+        assert email.sent_at.tzinfo is timezone.utc
+
+    def test_bulk_log_empty_is_noop(self, db):
+        assert log_outreach_emails_bulk(db, []) == 0
+        update_leads_status(db, [], LeadStatus.EMAILED)
+
+    def test_record_deliveries_logs_rows_and_marks_sent_leads(self, db):
+        from app.db.models import OutreachEmail
+
+        sent, failed = (
+            make_lead(db, make_normalized_job(job_url=f"https://remoteok.com/jobs/{i}"))
+            for i in range(2)
+        )
+        row = {"to_address": "cto@example.com", "subject": "Hi", "body": "Body"}
+        record_deliveries(db, [
+            {**row, "lead_id": sent.id, "delivery_status": DeliveryStatus.SENT,
+             "error_message": None, "sent_at": datetime.now(timezone.utc)},
+            {**row, "lead_id": failed.id, "delivery_status": DeliveryStatus.FAILED,
+             "error_message": "refused", "sent_at": None},
+        ])
+        db.expire_all()
+        assert db.get(Lead, sent.id).status == LeadStatus.EMAILED
+        assert db.get(Lead, failed.id).status == LeadStatus.QUALIFIED
+        statuses = {e.lead_id: e.delivery_status for e in db.query(OutreachEmail)}
+        assert statuses == {sent.id: DeliveryStatus.SENT, failed.id: DeliveryStatus.FAILED}
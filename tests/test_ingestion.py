@@ -4,10 +4,11 @@ tests/test_ingestion.py — Unit tests for the ingestion layer.
 Runs without network calls or DB connections by using sample data.
 """
 
+import copy
 import pytest
 from datetime import datetime
 
-from app.ingestion.normalizer import normalize_job, normalize_jobs, _strip_html, _extract_domain
+from app.ingestion.normalizer import normalize_job, normalize_jobs, _strip_html, _extract_domain, _normalize_title
 from app.ingestion.filters import keyword_filter, DEFAULT_BUYER_ROLES
 
 
@@ -53,12 +54,30 @@ class TestNormalizerHelpers:
     def test_strip_html_plain_text_unchanged(self):
         assert _strip_html("Just plain text") == "Just plain text"
 
+    def test_strip_html_decodes_entities_and_collapses_whitespace(self):
+        assert _strip_html("<p>R&amp;D\n\n  team&nbsp;<br/>lead</p>") == "R&D team lead"
+
+    def test_strip_html_drops_script_and_style(self):
+        assert _strip_html("<style>p {}</style><script>track()</script><p>Hi</p>") == "Hi"
+
+    def test_normalize_title(self):
+        assert _normalize_title("  senior   DEVOPS engineer ") == "Senior Devops Engineer"
+        assert _normalize_title("3rd line o'reilly support") == "3rd Line O'reilly Support"
+        assert _normalize_title("") == ""
+
     def test_extract_domain_basic(self):
         assert _extract_domain("https://www.acmecorp.io/logo.png") == "acmecorp.io"
 
     def test_extract_domain_strips_www(self):
         assert _extract_domain("https://www.example.com") == "example.com"
 
+    def test_extract_domain_stops_at_query_and_fragment(self):
+        assert _extract_domain("https://Remoteok.com?x=1") == "remoteok.com"
+        assert _extract_domain("https://acme.com#about") == "acme.com"
+
+    def test_extract_domain_scheme_relative(self):
+        assert _extract_domain("//cdn.acme.com/logo.png") == "cdn.acme.com"
+
     def test_extract_domain_none(self):
         assert _extract_domain(None) is None
 
@@ -82,6 +101,14 @@ class TestNormalizeJob:
         assert job.location == "Remote"
         assert "python" in job.tags
         assert isinstance(job.posted_at, datetime)
+        assert job.posted_at.tzinfo is not None
+
+    def test_does_not_mutate_input(self):
+        """The sample dicts are shared across tests, so normalizing must not change them."""
+        before = copy.deepcopy(SAMPLE_RAW_JOB)
+        job = normalize_job(SAMPLE_RAW_JOB)
+        job.tags.append("extra")
+        assert SAMPLE_RAW_JOB == before
 
     def test_missing_title_returns_none(self):
         result = normalize_job(SAMPLE_RAW_JOB_MISSING_FIELDS)
@@ -100,6 +127,14 @@ class TestNormalizeJob:
         assert job is not None
         assert len(job.description) <= 4000
 
+    def test_description_truncated_to_prompt_length(self):
+        """Stored text matches what qualify_lead would have sent to the LLM."""
+        from app.ai_engine.utils import truncate_for_context
+        raw = dict(SAMPLE_RAW_JOB)
+        raw["description"] = "y" * 5000
+        job = normalize_job(raw)
+        assert job.description == truncate_for_context("y" * 5000, max_chars=2000)
+
 
 class TestNormalizeJobs:
     def test_batch_normalizes_and_skips_invalid(self):
@@ -149,3 +184,90 @@ class TestKeywordFilter:
         jobs = [self._make_job("Head of Marketing")]
         result = keyword_filter(jobs, keywords=["marketing"])
         assert len(result) == 1
+
+    def test_matches_substrings_like_in_operator(self):
+        """Keywords match anywhere in the text, including inside longer words."""
+        jobs = [self._make_job("Senior DevOps Engineer"), self._make_job("Designer")]
+        result = keyword_filter(jobs, keywords=["ops eng", "zzz"])
+        assert [j.title for j in result] == ["Senior DevOps Engineer"]
+
+    def test_mixed_case_keywords_lowercased(self):
+        jobs = [self._make_job("Staff Engineer")]
+        assert len(keyword_filter(jobs, keywords=["STAFF ENGINEER"])) == 1
+
+    def test_empty_keyword_matches_everything(self):
+        jobs = [self._make_job("Graphic Designer")]
+        assert len(keyword_filter(jobs, keywords=["", "cto"])) == 1
+
+    def test_substring_fallback_without_pyahocorasick(self, monkeypatch):
+        """Same results when the optional Aho-Corasick extension is missing."""
+        from app.ingestion import filters
+        monkeypatch.setattr(filters, "ahocorasick", None)
+        filters._keyword_matcher.cache_clear()
+        try:
+            jobs = [self._make_job("Senior DevOps Engineer"), self._make_job("Designer")]
+            result = keyword_filter(jobs, keywords=["ops eng", "zzz"])
+            assert [j.title for j in result] == ["Senior DevOps Engineer"]
+        finally:
+            filters._keyword_matcher.cache_clear()
+
+
+# ── fetcher tests ─────────────────────────────────────────────────────────────
+
+class TestFetcher:
+    @pytest.fixture
+    def transport(self, monkeypatch):
+        """Route the fetcher's httpx client through a mock transport; no retry delay."""
+        import httpx
+        from tenacity import wait_none
+        from app.ingestion import fetcher
+
+        responses = []
+        clients = []
+        transport = httpx.MockTransport(lambda request: responses.pop(0))
+        real_client = httpx.AsyncClient
+
+        def client_factory(**kwargs):
+            clients.append(real_client(transport=transport, **kwargs))
+            return clients[-1]
+
+        monkeypatch.setattr(fetcher.httpx, "AsyncClient", client_factory)
+        monkeypatch.setattr(
+            fetcher, "_fetch_remoteok_raw", fetcher._fetch_remoteok_raw.retry_with(wait=wait_none()),
+        )
+        return responses, clients
+
+    def test_skips_legal_notice_and_applies_limit(self, transport):
+        import httpx
+        from app.ingestion.fetcher import fetch_jobs
+
+        responses, _ = transport
+        responses.append(httpx.Response(200, json=[{"legal": "notice"}, {"id": "1"}, {"id": "2"}]))
+        assert fetch_jobs(limit=1) == [{"id": "1"}]
+
+    def test_retries_on_the_same_client(self, transport):
+        import httpx
+        from app.ingestion.fetcher import fetch_jobs
+
+        responses, clients = transport
+        responses.extend([httpx.Response(503), httpx.Response(200, json=[{"id": "1"}])])
+        assert fetch_jobs(limit=10) == [{"id": "1"}]
+        assert len(clients) == 1
+        assert responses == []
+
+    def test_returns_empty_after_retries_exhausted(self, transport):
+        import httpx
+        from app.ingestion.fetcher import fetch_jobs
+
+        responses, _ = transport
+        responses.extend([httpx.Response(500)] * 3)
+        assert fetch_jobs(limit=10) == []
+
+    def test_non_json_body_returns_empty(self, transport):
+        import httpx
+        from app.ingestion.fetcher import fetch_jobs
+
+        responses, _ = transport
+        responses.extend([httpx.Response(200, text="<html>Just a moment...</html>")] * 3)
+        assert fetch_jobs(limit=10) == []
+        assert responses == []
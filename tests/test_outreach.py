@@ -7,12 +7,14 @@ No actual emails are sent and no SMTP connections are opened.
 conftest.py sets dummy env vars so pydantic-settings doesn't block.
 """
 
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import AsyncMock, MagicMock, patch, call
 from io import StringIO
 
 from app.outreach.templates import render_email, RenderedEmail
 from app.outreach.mailer import GmailMailer
+from app.services.outreach_service import adeliver_with_checkpoints, draft_kwargs_for_lead
 from app.db.models import DeliveryStatus
 
 
@@ -61,6 +63,14 @@ class TestRenderEmail:
         # Default sender_name is "Vithusan"
         assert "Vithusan" in result.html_body
 
+    def test_drafted_text_is_html_escaped(self):
+        result = render_email("Q&A <3", "Cut review time <50% & ship.\nWe'd love to help.", sender_name="A&B")
+        assert "<p>Cut review time &lt;50% &amp; ship.</p>" in result.html_body
+        assert "<p>We'd love to help.</p>" in result.html_body
+        assert "<title>Q&amp;A &lt;3</title>" in result.html_body
+        assert "<strong>A&amp;B</strong>" in result.html_body
+        assert result.plain_body == "Cut review time <50% & ship.\nWe'd love to help."
+
     def test_empty_body_does_not_crash(self):
         result = render_email("Subject", "")
         assert result.plain_body == ""
@@ -83,6 +93,14 @@ class TestGmailMailerDryRun:
         db = MagicMock()
         return db
 
+    @pytest.fixture(autouse=True)
+    def mock_repo(self, monkeypatch):
+        """Repository stub shared by every test in the class."""
+        repo = MagicMock()
+        repo.log_outreach_email.return_value = MagicMock(id=1)
+        monkeypatch.setattr("app.outreach.mailer.repository", repo)
+        return repo
+
     @pytest.fixture
     def sample_email(self):
         return render_email(
@@ -91,65 +109,213 @@ class TestGmailMailerDryRun:
         )
 
     def test_send_returns_true_in_dry_run(self, mailer, mock_db, sample_email):
-        from app.db.repository import log_outreach_email, update_email_delivery_status
-        with patch("app.outreach.mailer.repository") as mock_repo:
-            mock_repo.log_outreach_email.return_value = MagicMock(id=1)
-            result = mailer.send(
-                db=mock_db,
-                lead_id=1,
-                to_address="cto@example.com",
-                email=sample_email,
-            )
+        result = mailer.send(
+            db=mock_db,
+            lead_id=1,
+            to_address="cto@example.com",
+            email=sample_email,
+        )
         assert result is True
 
     def test_send_does_not_call_smtp(self, mailer, mock_db, sample_email):
         """Dry-run must never open an SMTP connection."""
-        with patch("app.outreach.mailer.repository") as mock_repo:
-            mock_repo.log_outreach_email.return_value = MagicMock(id=1)
-            with patch("app.outreach.mailer.smtplib.SMTP_SSL") as mock_smtp:
-                mailer.send(
-                    db=mock_db, lead_id=1,
-                    to_address="cto@example.com", email=sample_email,
-                )
-                mock_smtp.assert_not_called()
-
-    def test_send_logs_email_to_db(self, mailer, mock_db, sample_email):
-        """Dry-run should still log the email record to the DB."""
-        with patch("app.outreach.mailer.repository") as mock_repo:
-            mock_repo.log_outreach_email.return_value = MagicMock(id=42)
+        with patch("app.outreach.mailer.smtplib.SMTP_SSL") as mock_smtp:
             mailer.send(
-                db=mock_db, lead_id=7,
-                to_address="hr@startup.io", email=sample_email,
+                db=mock_db, lead_id=1,
+                to_address="cto@example.com", email=sample_email,
             )
-            mock_repo.log_outreach_email.assert_called_once()
-            call_kwargs = mock_repo.log_outreach_email.call_args.kwargs
-            assert call_kwargs["lead_id"] == 7
-            assert call_kwargs["subject"] == sample_email.subject
+            mock_smtp.assert_not_called()
+
+    def test_send_logs_email_to_db(self, mailer, mock_db, mock_repo, sample_email):
+        """Dry-run should still log the email record to the DB."""
+        mock_repo.log_outreach_email.return_value = MagicMock(id=42)
+        mailer.send(
+            db=mock_db, lead_id=7,
+            to_address="hr@startup.io", email=sample_email,
+        )
+        mock_repo.log_outreach_email.assert_called_once()
+        call_kwargs = mock_repo.log_outreach_email.call_args.kwargs
+        assert call_kwargs["lead_id"] == 7
+        assert call_kwargs["subject"] == sample_email.subject
 
-    def test_send_updates_status_to_sent(self, mailer, mock_db, sample_email):
+    def test_send_updates_status_to_sent(self, mailer, mock_db, mock_repo, sample_email):
         """After dry-run, delivery status should be updated to SENT."""
-        with patch("app.outreach.mailer.repository") as mock_repo:
-            mock_repo.log_outreach_email.return_value = MagicMock(id=99)
-            mailer.send(
-                db=mock_db, lead_id=1,
-                to_address="test@example.com", email=sample_email,
-            )
-            mock_repo.update_email_delivery_status.assert_called_once_with(
-                mock_db, 99, DeliveryStatus.SENT
-            )
+        mock_repo.log_outreach_email.return_value = MagicMock(id=99)
+        mailer.send(
+            db=mock_db, lead_id=1,
+            to_address="test@example.com", email=sample_email,
+        )
+        mock_repo.update_email_delivery_status.assert_called_once_with(
+            mock_db, 99, DeliveryStatus.SENT
+        )
 
     def test_dry_run_prints_to_stdout(self, mailer, mock_db, sample_email, capsys):
         """Dry-run should print the email body and subject to stdout."""
-        with patch("app.outreach.mailer.repository") as mock_repo:
-            mock_repo.log_outreach_email.return_value = MagicMock(id=1)
-            mailer.send(
-                db=mock_db, lead_id=1,
-                to_address="cto@example.com", email=sample_email,
-            )
+        mailer.send(
+            db=mock_db, lead_id=1,
+            to_address="cto@example.com", email=sample_email,
+        )
         captured = capsys.readouterr()
         assert sample_email.subject in captured.out
         assert "DRY RUN" in captured.out
 
+    @pytest.mark.asyncio
+    async def test_asend_dry_run_logs_sent_row(self, mailer, mock_db, mock_repo, sample_email):
+        """asend() in dry-run logs one SENT row without touching SMTP."""
+        with patch("app.outreach.mailer.smtplib.SMTP_SSL") as mock_smtp:
+            result = await mailer.asend(
+                db=mock_db, lead_id=3,
+                to_address="cto@example.com", email=sample_email,
+            )
+            mock_smtp.assert_not_called()
+        mock_repo.log_outreach_emails_bulk.assert_called_once()
+        db, [row] = mock_repo.log_outreach_emails_bulk.call_args.args
+        assert db is mock_db
+        assert row["lead_id"] == 3
+        assert row["delivery_status"] == DeliveryStatus.SENT
+        assert row["sent_at"] is not None
+        assert result is True
+
+    @pytest.mark.asyncio
+    async def test_adeliver_never_touches_db(self, mailer, mock_repo, sample_email):
+        delivery = await mailer.adeliver(7, "cto@example.com", sample_email)
+        assert delivery["delivery_status"] == DeliveryStatus.SENT
+        assert delivery["subject"] == sample_email.subject
+        assert mock_repo.mock_calls == []
+
+
+# ── GmailMailer — shared SMTP connection ──────────────────────────────────────
+
+class TestGmailMailerConnectionReuse:
+    """Real-send path with SMTP mocked out: one login per `with` block."""
+
+    @pytest.fixture
+    def sample_email(self):
+        return render_email(subject="Hello", plain_body="Hi there")
+
+    def _send_many(self, mailer, sample_email, count):
+        with patch("app.outreach.mailer.repository") as mock_repo:
+            mock_repo.log_outreach_email.return_value = MagicMock(id=1)
+            return [
+                mailer.send(db=MagicMock(), lead_id=i, to_address="cto@example.com", email=sample_email)
+                for i in range(count)
+            ]
+
+    def test_context_manager_logs_in_once(self, sample_email):
+        with patch("app.outreach.mailer.smtplib.SMTP_SSL") as mock_smtp:
+            with GmailMailer(dry_run=False) as mailer:
+                results = self._send_many(mailer, sample_email, 3)
+            server = mock_smtp.return_value
+            assert results == [True, True, True]
+            mock_smtp.assert_called_once()
+            server.login.assert_called_once()
+            assert server.sendmail.call_count == 3
+            server.quit.assert_called_once()
+
+    def test_without_context_manager_connects_per_email(self, sample_email):
+        with patch("app.outreach.mailer.smtplib.SMTP_SSL") as mock_smtp:
+            self._send_many(GmailMailer(dry_run=False), sample_email, 2)
+            assert mock_smtp.call_count == 2
+
+    def test_reconnects_after_server_disconnect(self, sample_email):
+        import smtplib
+        with patch("app.outreach.mailer.smtplib.SMTP_SSL") as mock_smtp:
+            server = mock_smtp.return_value
+            server.sendmail.side_effect = [None, smtplib.SMTPServerDisconnected("idle"), None]
+            with GmailMailer(dry_run=False) as mailer:
+                results = self._send_many(mailer, sample_email, 2)
+            assert results == [True, True]
+            assert mock_smtp.call_count == 2
+            assert server.sendmail.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_connection(self, sample_email):
+        """Without aiosmtplib, asend() shares the smtplib connection from a thread."""
+        with patch("app.outreach.mailer.smtplib.SMTP_SSL") as mock_smtp, \
+                patch("app.outreach.mailer.aiosmtplib", None):
+            with patch("app.outreach.mailer.repository") as mock_repo:
+                mock_repo.log_outreach_email.return_value = MagicMock(id=1)
+                async with GmailMailer(dry_run=False) as mailer:
+                    for _ in range(2):
+                        await mailer.asend(
+                            db=MagicMock(), lead_id=1,
+                            to_address="cto@example.com", email=sample_email,
+                        )
+            mock_smtp.assert_called_once()
+            mock_smtp.return_value.quit.assert_called_once()
+
+
+class TestGmailMailerAsyncSmtp:
+    """adeliver() over aiosmtplib (mocked): pooled sessions, overlapping sends."""
+
+    @pytest.fixture
+    def sample_email(self):
+        return render_email(subject="Hello", plain_body="Hi there")
+
+    @pytest.fixture
+    def clients(self):
+        """Patch aiosmtplib.SMTP; every connection made is appended to the list."""
+        import asyncio
+        made = []
+
+        async def slow_send(msg):
+            await asyncio.sleep(0.01)
+
+        def factory(**kwargs):
+            client = MagicMock(is_connected=True)
+            client.connect = AsyncMock()
+            client.login = AsyncMock()
+            client.quit = AsyncMock()
+            client.send_message = AsyncMock(side_effect=slow_send)
+            made.append(client)
+            return client
+
+        with patch("app.outreach.mailer.aiosmtplib.SMTP", side_effect=factory):
+            yield made
+
+    async def _send_many(self, mailer, sample_email, count):
+        import asyncio
+        deliveries = await asyncio.gather(*(
+            mailer.adeliver(i, "cto@example.com", sample_email) for i in range(count)
+        ))
+        return [d["delivery_status"] == DeliveryStatus.SENT for d in deliveries]
+
+    @pytest.mark.asyncio
+    async def test_sequential_sends_reuse_one_session(self, clients, sample_email):
+        async with GmailMailer(dry_run=False) as mailer:
+            for _ in range(3):
+                await self._send_many(mailer, sample_email, 1)
+        assert len(clients) == 1
+        clients[0].login.assert_awaited_once()
+        assert clients[0].send_message.await_count == 3
+        clients[0].quit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_use_bounded_pool(self, clients, sample_email):
+        from app.outreach.mailer import MAX_ASYNC_CONNECTIONS
+        async with GmailMailer(dry_run=False) as mailer:
+            results = await self._send_many(mailer, sample_email, 10)
+        assert all(results)
+        assert len(clients) == MAX_ASYNC_CONNECTIONS
+        assert sum(c.send_message.await_count for c in clients) == 10
+        assert all(c.quit.await_count == 1 for c in clients)
+
+    @pytest.mark.asyncio
+    async def test_without_context_manager_sends_one_off(self, sample_email):
+        with patch("app.outreach.mailer.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
+            results = await self._send_many(GmailMailer(dry_run=False), sample_email, 2)
+        assert results == [True, True]
+        assert mock_send.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_smtp_error_returns_failed_row(self, sample_email):
+        with patch("app.outreach.mailer.aiosmtplib.send", new_callable=AsyncMock) as mock_send:
+            mock_send.side_effect = OSError("connection refused")
+            delivery = await GmailMailer(dry_run=False).adeliver(1, "cto@example.com", sample_email)
+        assert delivery["delivery_status"] == DeliveryStatus.FAILED
+        assert delivery["error_message"] == "connection refused"
+        assert delivery["sent_at"] is None
+
 
 # ── GmailMailer init ──────────────────────────────────────────────────────────
 
@@ -167,3 +333,79 @@ class TestGmailMailerInit:
         from app.config import settings
         mailer = GmailMailer()
         assert mailer.dry_run == settings.mailer_dry_run
+
+
+# ── draft_kwargs_for_lead ─────────────────────────────────────────────────────
+
+class TestDraftKwargsForLead:
+    def test_builds_draft_arguments_from_lead(self):
+        lead = MagicMock(
+            contact_role="CTO", reason="Growing team.",
+            company_pain_points='["slow reviews"]',
+        )
+        lead.company.name = "Acme"
+        lead.job_posting.title = "VP Engineering"
+        kwargs = draft_kwargs_for_lead(lead)
+        assert kwargs["company_name"] == "Acme"
+        assert kwargs["job_title"] == "VP Engineering"
+        assert kwargs["contact_role"] == "CTO"
+        assert kwargs["pain_points"] == ["slow reviews"]
+
+    def test_missing_relations_and_bad_pain_points_fall_back(self):
+        lead = MagicMock(
+            company=None, job_posting=None, contact_role=None, reason=None,
+            company_pain_points="not json",
+        )
+        kwargs = draft_kwargs_for_lead(lead)
+        assert kwargs["company_name"] == kwargs["job_title"] == "Unknown"
+        assert kwargs["contact_role"] == "Engineering Leader"
+        assert kwargs["pain_points"] == []
+
+
+# ── adeliver_with_checkpoints ─────────────────────────────────────────────────
+
+class TestAdeliverWithCheckpoints:
+    @pytest.fixture
+    def recorded(self, monkeypatch):
+        """Checkpoint every 2 rows; capture the lead ids of each recorded batch."""
+        from app.services import outreach_service
+
+        monkeypatch.setattr(outreach_service, "OUTREACH_COMMIT_EVERY", 2)
+        recorded = []
+        monkeypatch.setattr(
+            outreach_service, "record_deliveries",
+            lambda db, rows: recorded.append([row["lead_id"] for row in rows]),
+        )
+        return recorded
+
+    @pytest.mark.asyncio
+    async def test_records_every_n_finished_rows(self, recorded):
+        async def deliver(lead_id):
+            if lead_id == 3:
+                raise RuntimeError("boom")
+            return None if lead_id == 4 else {"lead_id": lead_id}
+
+        results = await adeliver_with_checkpoints(MagicMock(), [0, 1, 2, 3, 4], deliver, concurrency=2)
+        assert sorted(sum(recorded, [])) == [0, 1, 2]
+        assert all(len(batch) <= 2 for batch in recorded)
+        assert [r["lead_id"] for r in results[:3]] == [0, 1, 2]
+        assert isinstance(results[3], RuntimeError)
+        assert results[4] is None
+
+    @pytest.mark.asyncio
+    async def test_slow_lead_does_not_hold_back_later_ones(self, recorded):
+        """Lead 0 only finishes once lead 3 has run — a per-chunk barrier would deadlock."""
+        release = asyncio.Event()
+
+        async def deliver(lead_id):
+            if lead_id == 0:
+                await release.wait()
+            elif lead_id == 3:
+                release.set()
+            return {"lead_id": lead_id}
+
+        await asyncio.wait_for(
+            adeliver_with_checkpoints(MagicMock(), [0, 1, 2, 3], deliver, concurrency=2), timeout=5,
+        )
+        assert recorded[0] == [1, 2]
+        assert sorted(sum(recorded, [])) == [0, 1, 2, 3]